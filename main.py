@@ -9,6 +9,7 @@ import os
 from typing import Dict
 import json
 import uuid
+import threading
 import yaml
 import platformdirs
 from typing import Optional
@@ -21,8 +22,16 @@ from src.project_manager import ProjectManager
 
 
 from src.utils import convert_pptx_to_pdf
+from src.utils import warmup_pdf_converter
 from src.utils import force_delete_directory
 from src.utils import logger
+from src.utils import configure_console_logging
+
+# Application entry：Enable console log output
+configure_console_logging()
+
+# priority use libyaml of C accomplish
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 app = FastAPI(
     title="PPTXSlideshow editor", description="Online editingPPTXpresentation"
@@ -35,6 +44,12 @@ file_locks = FileLockManager()
 project_manager = ProjectManager()
 
 
+@app.on_event("startup")
+async def warmup_converters():
+    """Preheat the PDF converter in the background（Does not block startup）"""
+    threading.Thread(target=warmup_pdf_converter, daemon=True).start()
+
+
 class SlideUpdate(BaseModel):
     session_id: str
     current_slide: int
@@ -72,81 +87,85 @@ async def save_changes(update: SlideUpdate):
         total_paragraphs_saved = 0
         total_tables_saved = 0
 
-        for shape_id, change_data in shape_changes.items():
-            try:
-                logger.debug(f"🔄 Processing: {shape_id}")
-
-                # 🎯 Analyze shapesID
-                parts = shape_id.split("_")
-                if not (
-                    len(parts) >= 4 and parts[0] == "slide" and parts[2] == "shape"
-                ):
-                    logger.debug(f"⚠️ Invalid shape ID format: {shape_id}")
-                    file_save_failed += 1
-                    continue
-
-                slide_idx = int(parts[1])
-
-                # 🎯 Determine the data type and process accordingly
-                success = False
-
-                # Condition1：text data（Include'txt'Field）
-                if isinstance(change_data, dict) and "txt" in change_data:
-                    structured_data = change_data["txt"]
-                    if isinstance(structured_data, list):
-                        # statisticsruns
-                        runs_count = 0
-                        for para in structured_data:
-                            runs_count += len(para.get("runs", []))
-
-                        # Save text data
-                        success = project_manager.save_structured_data_to_json(
-                            project_dir, slide_idx, shape_id, structured_data
+        # Batch write：Each slide file is written once after all shapes are processed
+        with project_manager.batch_slide_writes():
+            for shape_id, change_data in shape_changes.items():
+                try:
+                    logger.debug(f"🔄 Processing: {shape_id}")
+
+                    # 🎯 Analyze shapesID
+                    parts = shape_id.split("_")
+                    if not (
+                        len(parts) >= 4 and parts[0] == "slide" and parts[2] == "shape"
+                    ):
+                        logger.debug(f"⚠️ Invalid shape ID format: {shape_id}")
+                        file_save_failed += 1
+                        continue
+
+                    slide_idx = int(parts[1])
+
+                    # 🎯 Determine the data type and process accordingly
+                    success = False
+
+                    # Condition1：text data（Include'txt'Field）
+                    if isinstance(change_data, dict) and "txt" in change_data:
+                        structured_data = change_data["txt"]
+                        if isinstance(structured_data, list):
+                            # statisticsruns
+                            runs_count = 0
+                            for para in structured_data:
+                                runs_count += len(para.get("runs", []))
+
+                            # Save text data
+                            success = project_manager.save_structured_data_to_json(
+                                project_dir, slide_idx, shape_id, structured_data
+                            )
+
+                            if success:
+                                total_runs_saved += runs_count
+                                total_paragraphs_saved += len(structured_data)
+                                logger.debug(
+                                    f"  - ✅ Text data saved ({runs_count} runs)"
+                                )
+
+                    # 🎯 Condition2：tabular data（Include'type': 'table'）
+                    elif (
+                        isinstance(change_data, dict)
+                        and change_data.get("type") == "table"
+                        and "changes" in change_data
+                    ):
+
+                        # Call the table save function
+                        success = project_manager.save_table_changes(
+                            project_dir,
+                            slide_idx,
+                            shape_id,
+                            change_data["changes"],
+                            change_data.get("original_data", "[]"),
                         )
 
                         if success:
-                            total_runs_saved += runs_count
-                            total_paragraphs_saved += len(structured_data)
-                            logger.debug(f"  - ✅ Text data saved ({runs_count} runs)")
-
-                # 🎯 Condition2：tabular data（Include'type': 'table'）
-                elif (
-                    isinstance(change_data, dict)
-                    and change_data.get("type") == "table"
-                    and "changes" in change_data
-                ):
-
-                    # Call the table save function
-                    success = project_manager.save_table_changes(
-                        project_dir,
-                        slide_idx,
-                        shape_id,
-                        change_data["changes"],
-                        change_data.get("original_data", "[]"),
-                    )
+                            total_tables_saved += 1
+                            logger.debug(f"  - ✅ Table data saved")
 
-                    if success:
-                        total_tables_saved += 1
-                        logger.debug(f"  - ✅ Table data saved")
+                    # Condition3：other formats（jump over）
+                    else:
+                        logger.debug(
+                            f"⚠️ Unsupported data format for {shape_id}: {type(change_data)}"
+                        )
+                        file_save_failed += 1
+                        continue
 
-                # Condition3：other formats（jump over）
-                else:
-                    logger.debug(
-                        f"⚠️ Unsupported data format for {shape_id}: {type(change_data)}"
-                    )
-                    file_save_failed += 1
-                    continue
+                    # Update statistics
+                    if success:
+                        file_save_success += 1
+                    else:
+                        file_save_failed += 1
 
-                # Update statistics
-                if success:
-                    file_save_success += 1
-                else:
+                except Exception as e:
+                    logger.debug(f"❌ Failed to process {shape_id}: {e}")
                     file_save_failed += 1
 
-            except Exception as e:
-                logger.debug(f"❌ Failed to process {shape_id}: {e}")
-                file_save_failed += 1
-
         # Update projectYAML
         try:
             project_manager.update_project_yaml(update.session_id)
@@ -341,7 +360,7 @@ async def editor_page(session_id: str):
         # Get project information
         project_dir = project_data_obj.get("project_dir", "")
         project_data = project_data_obj.get("project_data", {})
-        content_structure = project_data_obj.get("content", [])
+        content_structure = project_manager.get_project_content(project_data_obj)
 
         # make sureslidesis an array
         slides = content_structure
@@ -377,11 +396,11 @@ async def editor_page(session_id: str):
             # Get snapshot description
             commit_hash = snapshot_status.get("commit_hash")
             if commit_hash:
-                log_success, log_output = git_manager._run_git_command(
-                    ["log", "--format=%s", "-n", "1", commit_hash]
-                )
-                if log_success:
-                    snapshot_extra_data["snapshot_description"] = log_output.strip()
+                commit_summary = git_manager.get_commit_summary(commit_hash)
+                if commit_summary:
+                    snapshot_extra_data["snapshot_description"] = commit_summary[
+                        "message"
+                    ]
         data_injection = f"""
         <script type="module">
         import {{ logger }} from "/static/js/logger.js";
@@ -646,7 +665,7 @@ async def verify_session(session_id: str):
     if not project_data_obj:
         return {"valid": False, "error": "Session does not exist"}
 
-    content = project_data_obj.get("content", {})
+    content = project_manager.get_project_content(project_data_obj)
     project_data = project_data_obj.get("project_data", {})
 
     return {
@@ -672,13 +691,17 @@ async def debug_all_sessions():
 
     for session_id, project_id in project_manager.sessions.items():
         project = project_manager.projects.get(project_id)
+        # Content is loaded lazily：Only count loaded content，Do not trigger loading
+        content_loaded = bool(project) and "content" in project
+        content = project["content"] if content_loaded else None
         sessions_info.append(
             {
                 "session_id": session_id,
                 "project_id": project_id,
                 "project_dir": project.get("project_dir", "N/A") if project else "N/A",
-                "content_length": len(project.get("content", [])) if project else 0,
-                "has_content": bool(project.get("content")) if project else False,
+                "content_loaded": content_loaded,
+                "content_length": len(content) if content else 0,
+                "has_content": bool(content) if content_loaded else None,
             }
         )
 
@@ -785,8 +808,8 @@ async def api_delete_project(session_id: str):
             # Read project name
             yaml_path = os.path.join(project_dir, "project.yaml")
             if os.path.exists(yaml_path):
-                with open(yaml_path, "r", encoding="utf-8") as f:
-                    project_data = yaml.safe_load(f)
+                with open(yaml_path, "rb") as f:
+                    project_data = yaml.load(f.read(), Loader=_YAML_LOADER)
                 project_name = project_data.get("project", {}).get(
                     "name", "Unnamed project"
                 )
@@ -1892,11 +1915,9 @@ async def get_snapshot_status(session_id: str):
             # Get snapshot description
             commit_hash = status.get("commit_hash")
             if commit_hash:
-                log_success, log_output = git_manager._run_git_command(
-                    ["log", "--format=%s", "-n", "1", commit_hash]
-                )
-                if log_success:
-                    details["description"] = log_output.strip()
+                commit_summary = git_manager.get_commit_summary(commit_hash)
+                if commit_summary:
+                    details["description"] = commit_summary["message"]
 
             # Get file change information
             if commit_hash:
@@ -2036,12 +2057,9 @@ async def export_presentation_pdf(session_id: str):
 
         traceback.print_exc()
 
-        # Clean temporary files
-        try:
-            if pptx_path and os.path.exists(pptx_path):
-                os.unlink(pptx_path)
-        except:
-            pass
+        # PPTX is a shared build cache（May be downloading by concurrent exports）：
+        # Only invalidate the cache entry，Do not delete the file
+        project_manager._pptx_cache.pop(session_id, None)
 
         try:
             if (
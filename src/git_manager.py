@@ -1,17 +1,30 @@
 # src/git_manager.py
 import os
+import sys
+import gc
 import subprocess
 import json
+import logging
 import shutil
 import tempfile
+import threading
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
-import traceback
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import os
 import subprocess
 from src.utils import logger
 
+try:
+    import psutil
+
+    _HAS_PSUTIL = True
+except ImportError:
+    _HAS_PSUTIL = False
+
+# Only Windows The path separator needs to be converted to POSIX
+_SEP_FIX = os.sep == "\\"
+
 GITIGNORE_TEMPLATE = """# ========================================
 # PPTX Express project Git Ignore configuration
 # ========================================
@@ -118,6 +131,46 @@ class GitManager:
         self.is_operating = False
         self.last_error = None
 
+        # Result of the last text file scan（None until first scan）
+        self._text_files_cache: Optional[List[str]] = None
+
+        # Long-lived git cat-file processes，keyed by mode（"--batch-check"/"--batch"）
+        self._catfile_procs: Dict[str, subprocess.Popen] = {}
+        self._catfile_lock = threading.Lock()
+
+        # Reuse one minimal environment for all git subprocesses
+        self._git_env = self._build_git_env()
+
+    def _build_git_env(self) -> Dict[str, str]:
+        """
+        Build a minimal environment for git subprocesses
+
+        Returns:
+            environment variable dictionary
+        """
+        env = {
+            "PATH": os.environ.get("PATH", ""),
+            "HOME": os.environ.get("HOME", ""),
+            "LANG": "C",
+            # Read-only commands（status/diffwait）Don't grab index lock
+            "GIT_OPTIONAL_LOCKS": "0",
+            "GIT_DIR": str(self.git_dir),
+            "GIT_WORK_TREE": str(self.project_dir),
+        }
+
+        if sys.platform == "win32":
+            for key in (
+                "SYSTEMROOT",
+                "APPDATA",
+                "USERPROFILE",
+                "HOMEDRIVE",
+                "HOMEPATH",
+            ):
+                if key in os.environ:
+                    env[key] = os.environ[key]
+
+        return env
+
     def _run_git_command(
         self, args: List[str], cwd: str = None, capture_output: bool = True
     ) -> Tuple[bool, str]:
@@ -142,6 +195,7 @@ class GitManager:
             result = subprocess.run(
                 cmd,
                 cwd=cwd,
+                env=self._git_env,
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
@@ -211,8 +265,7 @@ class GitManager:
                 f"implementGitAn unknown error occurred while commanding: {str(e)}"
             )
             self.last_error = error_msg
-            logger.debug(f"❌ {error_msg}")
-            traceback.print_exc()
+            logger.debug("❌ %s", error_msg, exc_info=True)
             return False, error_msg
 
     def init_repository(self, force: bool = False) -> Dict[str, Any]:
@@ -264,6 +317,12 @@ class GitManager:
                 capture_output=False,
             )
 
+            # Let git's own post-commit auto-gc run in the background
+            self._run_git_command(["config", "gc.auto", "6700"], capture_output=False)
+            self._run_git_command(
+                ["config", "gc.autoDetach", "true"], capture_output=False
+            )
+
             # 3. create.gitignoredocument
             gitignore_path = os.path.join(self.project_dir, ".gitignore")
             try:
@@ -336,8 +395,7 @@ class GitManager:
 
         except Exception as e:
             error_msg = f"initializationGitAn error occurred in the warehouse: {str(e)}"
-            logger.debug(f"❌ {error_msg}")
-            traceback.print_exc()
+            logger.debug("❌ %s", error_msg, exc_info=True)
             return {"success": False, "message": error_msg, "repo_exists": False}
 
     def create_snapshot(self, message: str = "", user: str = None) -> Dict[str, Any]:
@@ -468,8 +526,7 @@ class GitManager:
 
         except Exception as e:
             error_msg = f"An error occurred while creating the snapshot: {str(e)}"
-            logger.debug(f"❌ {error_msg}")
-            traceback.print_exc()
+            logger.debug("❌ %s", error_msg, exc_info=True)
             return {
                 "success": False,
                 "message": error_msg,
@@ -706,7 +763,12 @@ class GitManager:
                             try:
                                 import yaml
 
-                                yaml_data = yaml.safe_load(file_content)
+                                yaml_data = yaml.load(
+                                    file_content,
+                                    Loader=getattr(
+                                        yaml, "CSafeLoader", yaml.SafeLoader
+                                    ),
+                                )
                                 if isinstance(yaml_data, dict):
                                     snapshot_content["metadata"].update(
                                         {
@@ -728,12 +790,11 @@ class GitManager:
                                 pass
 
             # Get commit information as additional metadata
-            log_success, log_output = self._run_git_command(
-                ["log", "--format=%s", "-n", "1", commit_hash]
-            )
-
-            if log_success:
-                snapshot_content["metadata"]["commit_message"] = log_output.strip()
+            commit_summary = self.get_commit_summary(commit_hash)
+            if commit_summary:
+                snapshot_content["metadata"]["commit_message"] = commit_summary[
+                    "message"
+                ]
 
             logger.debug(
                 f"✅ Obtaining snapshot content successfully: {commit_hash[:8]}, Include {len(snapshot_content['files'])} files"
@@ -748,8 +809,7 @@ class GitManager:
 
         except Exception as e:
             error_msg = f"Failed to obtain snapshot content: {str(e)}"
-            logger.debug(f"❌ {error_msg}")
-            traceback.print_exc()
+            logger.debug("❌ %s", error_msg, exc_info=True)
             return {"success": False, "message": error_msg, "content": None}
 
     def _commit_exists(self, commit_hash: str) -> bool:
@@ -762,8 +822,138 @@ class GitManager:
         Returns:
             exists
         """
-        success, _ = self._run_git_command(["cat-file", "-e", commit_hash])
-        return success
+        header = self._catfile_query("--batch-check", commit_hash)
+        if header is None:
+            # Persistent process unavailable，fall back to a one-off command
+            success, _ = self._run_git_command(["cat-file", "-e", commit_hash])
+            return success
+
+        return not header[0].endswith((b" missing", b" ambiguous"))
+
+    def get_commit_summary(self, commit_hash: str) -> Optional[Dict[str, str]]:
+        """
+        Get the subject and author date of a commit（like log --format=%s|%ai）
+
+        Args:
+            commit_hash: commit hash（full or brief）
+
+        Returns:
+            {"message": ..., "date": ...}，Return if the commit cannot be readNone
+        """
+        result = self._catfile_query("--batch", commit_hash)
+        if result is None:
+            success, output = self._run_git_command(
+                ["log", "--format=%s|%ai", "-n", "1", commit_hash]
+            )
+            if not success:
+                return None
+            parts = output.strip().split("|", 1)
+            if len(parts) != 2:
+                return None
+            return {"message": parts[0], "date": parts[1]}
+
+        header, body = result
+        fields = header.split()
+        if len(fields) < 2 or fields[1] != b"commit" or body is None:
+            return None
+
+        text = body.decode("utf-8", errors="replace")
+        headers, _, commit_message = text.partition("\n\n")
+
+        date_str = ""
+        for line in headers.split("\n"):
+            if line.startswith("author "):
+                date_str = self._format_git_date(line)
+                break
+
+        # %s: first paragraph of the message joined into one line
+        first_paragraph = commit_message.split("\n\n", 1)[0]
+        subject = " ".join(l.strip() for l in first_paragraph.splitlines()).strip()
+
+        return {"message": subject, "date": date_str}
+
+    @staticmethod
+    def _format_git_date(signature_line: str) -> str:
+        """Convert 'author Name <mail> 1700000000 +0800' into %ai format"""
+        try:
+            _, timestamp, tz = signature_line.rsplit(" ", 2)
+            sign = -1 if tz[0] == "-" else 1
+            offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5])) * sign
+            moment = datetime.fromtimestamp(int(timestamp), timezone(offset))
+            return f"{moment.strftime('%Y-%m-%d %H:%M:%S')} {tz}"
+        except (ValueError, IndexError):
+            return ""
+
+    def _catfile_query(
+        self, mode: str, object_name: str
+    ) -> Optional[Tuple[bytes, Optional[bytes]]]:
+        """
+        Ask a persistent git cat-file process about one object
+
+        Args:
+            mode: "--batch-check" or "--batch"
+            object_name: commit hash or revision
+
+        Returns:
+            (header line, object content or None)，Return None if the process is unavailable
+        """
+        if not object_name or any(c.isspace() for c in object_name):
+            return (object_name.encode("utf-8", errors="replace") + b" missing", None)
+
+        if not self.git_dir.exists():
+            return None
+
+        # git batch mode is not thread-safe，serialize requests
+        with self._catfile_lock:
+            proc = self._catfile_procs.get(mode)
+            try:
+                if proc is None or proc.poll() is not None:
+                    proc = subprocess.Popen(
+                        ["git", "cat-file", mode],
+                        cwd=self.project_dir,
+                        env=self._git_env,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                    self._catfile_procs[mode] = proc
+
+                proc.stdin.write(object_name.encode("utf-8") + b"\n")
+                proc.stdin.flush()
+
+                header = proc.stdout.readline().rstrip(b"\n")
+                if not header:
+                    raise OSError("git cat-file closed its output")
+
+                body = None
+                fields = header.split()
+                if mode == "--batch" and len(fields) == 3 and fields[2].isdigit():
+                    body = proc.stdout.read(int(fields[2]))
+                    proc.stdout.read(1)  # trailing newline
+
+                return header, body
+
+            except (OSError, ValueError) as e:
+                logger.debug("⚠️ git cat-file %s unavailable: %s", mode, e)
+                self._close_catfile_process(mode)
+                return None
+
+    def _close_catfile_process(self, mode: str):
+        """Terminate one persistent cat-file process"""
+        proc = self._catfile_procs.pop(mode, None)
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+    def close_catfile_processes(self):
+        """Terminate all persistent cat-file processes"""
+        with self._catfile_lock:
+            for mode in list(self._catfile_procs):
+                self._close_catfile_process(mode)
 
     def restore_snapshot(self, commit_hash: str) -> Dict[str, Any]:
         """
@@ -808,8 +998,7 @@ class GitManager:
 
         except Exception as e:
             error_msg = f"Rollback failed: {str(e)}"
-            logger.debug(f"❌ {error_msg}")
-            traceback.print_exc()
+            logger.debug("❌ %s", error_msg, exc_info=True)
             return {"success": False, "message": error_msg, "restored": False}
 
     def get_status(self) -> Dict[str, Any]:
@@ -902,7 +1091,11 @@ class GitManager:
         """examineGitIs it available"""
         try:
             result = subprocess.run(
-                ["git", "--version"], capture_output=True, text=True, timeout=5
+                ["git", "--version"],
+                env=self._git_env,
+                capture_output=True,
+                text=True,
+                timeout=5,
             )
             return result.returncode == 0
         except:
@@ -978,8 +1171,7 @@ class GitManager:
         for filename in key_files:
             file_path = project_path / filename
             if file_path.is_file():
-                rel_path = str(file_path.relative_to(project_path))
-                text_files.append(rel_path.replace("\\", "/"))
+                text_files.append(filename)
 
         # 2. slidesall in directoryJSONdocument
         slides_dir = project_path / "slides"
@@ -987,18 +1179,30 @@ class GitManager:
             for json_file in slides_dir.rglob("*.json"):
                 if json_file.is_file():
                     rel_path = str(json_file.relative_to(project_path))
-                    text_files.append(rel_path.replace("\\", "/"))
+                    if _SEP_FIX:
+                        rel_path = rel_path.replace("\\", "/")
+                    text_files.append(rel_path)
 
         # 3. Other possible configuration files
         other_files = ["README.md", "CHANGELOG.md", "LICENSE"]
         for filename in other_files:
             file_path = project_path / filename
             if file_path.is_file():
-                rel_path = str(file_path.relative_to(project_path))
-                text_files.append(rel_path.replace("\\", "/"))
+                text_files.append(filename)
 
         # Remove duplicates and sort
-        return sorted(set(text_files))
+        text_files = sorted(set(text_files))
+        self._text_files_cache = text_files
+        return list(text_files)
+
+    def refresh_text_files(self) -> int:
+        """
+        Rescan the tracked text files and refresh the cached count
+
+        Returns:
+            Number of text files found
+        """
+        return len(self._find_text_files())
 
     def get_repository_info(self) -> Dict[str, Any]:
         """
@@ -1020,7 +1224,12 @@ class GitManager:
             "gitignore_exists": os.path.exists(
                 os.path.join(self.project_dir, ".gitignore")
             ),
-            "text_files_count": len(self._find_text_files()),
+            # Count from the last scan; call refresh_text_files() to rescan
+            "text_files_count": (
+                len(self._text_files_cache)
+                if self._text_files_cache is not None
+                else None
+            ),
             "git_available": self._check_git_available(),
             "is_operating": self.is_operating,
             "last_error": self.last_error,
@@ -1057,9 +1266,7 @@ class GitManager:
             Switch results
         """
         try:
-            logger.debug(
-                f"👀 Switch to snapshot viewing mode: {commit_hash[:8] if len(commit_hash) >= 8 else commit_hash}"
-            )
+            logger.debug("👀 Switch to snapshot viewing mode: %s", commit_hash[:8])
 
             # 1. Verify commit hash
             if not self._commit_exists(commit_hash):
@@ -1073,8 +1280,17 @@ class GitManager:
             current_status = self._save_current_state()
 
             # 3. implement git checkout（separationHEADmodel）
-            logger.debug(f"🔧 implement git checkout {commit_hash}...")
-            success, message = self._run_git_command(["checkout", commit_hash])
+            logger.debug("🔧 implement git checkout %s...", commit_hash)
+            success, message = self._run_git_command(
+                [
+                    "-c",
+                    "advice.detachedHead=false",
+                    "checkout",
+                    "--quiet",
+                    "--detach",
+                    commit_hash,
+                ]
+            )
 
             if not success:
                 # Try to restore the original state
@@ -1097,19 +1313,12 @@ class GitManager:
             self._save_snapshot_info(snapshot_info)
 
             # 5. Get snapshot details
-            log_success, log_output = self._run_git_command(
-                ["log", "--format=%s|%ai", "-n", "1", commit_hash]
-            )
+            commit_info = self.get_commit_summary(commit_hash) or {}
 
-            commit_info = {}
-            if log_success:
-                parts = log_output.strip().split("|", 1)
-                if len(parts) == 2:
-                    commit_info = {"message": parts[0], "date": parts[1]}
-
-            logger.debug(f"✅ Switched to snapshot: {commit_hash[:8]}")
-            logger.debug(f"   describe: {commit_info.get('message', 'unknown')}")
-            logger.debug(f"   time: {commit_info.get('date', 'unknown')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✅ Switched to snapshot: %s", commit_hash[:8])
+                logger.debug("   describe: %s", commit_info.get("message", "unknown"))
+                logger.debug("   time: %s", commit_info.get("date", "unknown"))
 
             return {
                 "success": True,
@@ -1123,8 +1332,7 @@ class GitManager:
 
         except Exception as e:
             error_msg = f"Switching to snapshot failed: {str(e)}"
-            logger.debug(f"❌ {error_msg}")
-            traceback.print_exc()
+            logger.debug("❌ %s", error_msg, exc_info=True)
             return {"success": False, "message": error_msg, "error_type": "exception"}
 
     def recover_from_snapshot(self) -> Dict[str, Any]:
@@ -1135,7 +1343,7 @@ class GitManager:
             Recovery results
         """
         try:
-            logger.debug(f"🔄 Restoring from Snapshot View Mode...")
+            logger.debug("🔄 Restoring from Snapshot View Mode...")
 
             # 1. Check if you are in snapshot viewing mode
             snapshot_info = self._load_snapshot_info()
@@ -1156,7 +1364,9 @@ class GitManager:
 
             # 2. Perform recovery（Return to original branch/submit）
             logger.debug(
-                f"🔧 Restore original state: {original_state.get('type', 'unknown')} - {original_state.get('ref', 'unknown')}"
+                "🔧 Restore original state: %s - %s",
+                original_state.get("type", "unknown"),
+                original_state.get("ref", "unknown"),
             )
 
             if original_state.get("type") == "branch":
@@ -1184,11 +1394,11 @@ class GitManager:
             # 4. If there were previously uncommitted changes，try to restore
             if original_state.get("has_uncommitted_changes"):
                 logger.debug(
-                    f"⚠️ Notice：Uncommitted changes to the original state were detected during recovery"
+                    "⚠️ Notice：Uncommitted changes to the original state were detected during recovery"
                 )
                 # Users may need to handle these changes manually
 
-            logger.debug(f"✅ Restored from snapshot view mode")
+            logger.debug("✅ Restored from snapshot view mode")
 
             return {
                 "success": True,
@@ -1199,10 +1409,27 @@ class GitManager:
 
         except Exception as e:
             error_msg = f"Restore from snapshot failed: {str(e)}"
-            logger.debug(f"❌ {error_msg}")
-            traceback.print_exc()
+            logger.debug("❌ %s", error_msg, exc_info=True)
             return {"success": False, "message": error_msg, "error_type": "exception"}
 
+    def _switch_branch(self, branch: str) -> Tuple[bool, str]:
+        """
+        switch to branch（priority use git switch，Old version or non-branch fallback checkout）
+
+        Args:
+            branch: Branch name
+
+        Returns:
+            (success, message)
+        """
+        success, message = self._run_git_command(["switch", "--quiet", branch])
+        if success:
+            return success, message
+
+        # git < 2.23 No switch Order，or ref Not a branch（like HEAD）
+        logger.debug("⚠️ git switch failed，fallback checkout: %s", message)
+        return self._run_git_command(["checkout", "--quiet", branch])
+
     def _save_current_state(self) -> Dict[str, Any]:
         """
         save currentGitstate
@@ -1277,7 +1504,19 @@ class GitManager:
                 logger.debug(f"⚠️ missing from statusrefinformation")
                 return False
 
-            success, message = self._run_git_command(["checkout", ref])
+            if state.get("type") == "branch":
+                success, message = self._switch_branch(ref)
+            else:
+                success, message = self._run_git_command(
+                    [
+                        "-c",
+                        "advice.detachedHead=false",
+                        "checkout",
+                        "--quiet",
+                        "--detach",
+                        ref,
+                    ]
+                )
 
             if success:
                 logger.debug(
@@ -1383,7 +1622,7 @@ class GitManager:
 
             # 1. try to restore tomaster/mainbranch
             for branch in ["main", "master", "HEAD"]:
-                success, message = self._run_git_command(["checkout", branch])
+                success, message = self._switch_branch(branch)
                 if success:
                     logger.debug(f"✅ Force switch to branch: {branch}")
                     break
@@ -1432,6 +1671,26 @@ class GitManager:
             return result.get("success", False)
         return True
 
+    def maintenance(self) -> Dict[str, Any]:
+        """
+        Explicit housekeeping of the repository（rarely needed）
+        git already runs gc --auto after commits，so this is only for manual use
+
+        Returns:
+            Maintenance results
+        """
+        if not os.path.exists(self.git_dir):
+            return {"success": False, "message": "noGitstorehouse"}
+
+        success, message = self._run_git_command(
+            ["maintenance", "run", "--task=gc", "--auto"]
+        )
+        if not success:
+            # git < 2.30 has no maintenance command
+            success, message = self._run_git_command(["gc", "--auto"])
+
+        return {"success": success, "message": message}
+
     def cleanup_repository(self) -> Dict[str, Any]:
         """
         clean upGitstorehouse，Release file lock
@@ -1462,11 +1721,13 @@ class GitManager:
                             "❌ Force recovery failed，But still continue to clean up"
                         )
 
-            # 2. reset all possibleGitoperate
+            # 2. Stop the persistent cat-file processes（they hold repository files open）
+            self.close_catfile_processes()
+
+            # 3. reset all possibleGitoperate
             operations = [
                 ["reset", "--hard", "HEAD"],
                 ["clean", "-fd"],
-                ["gc", "--auto"],
                 [
                     "config",
                     "--unset-all",
@@ -1480,31 +1741,25 @@ class GitManager:
                 except:
                     pass  # Ignore failures of individual commands
 
-            # 3. make sureGitProcess ends
-            try:
-                import psutil
-
+            # 4. make sureGitProcess ends
+            if _HAS_PSUTIL:
                 for proc in psutil.process_iter(["pid", "name", "cmdline"]):
                     try:
                         cmdline = proc.info.get("cmdline", [])
                         if cmdline and "git" in cmdline[0].lower():
-                            if self.git_dir in " ".join(cmdline):
+                            if str(self.git_dir) in " ".join(cmdline):
                                 logger.debug(
                                     f"🛑 terminationGitprocess: {proc.info['pid']}"
                                 )
                                 proc.terminate()
                     except:
                         pass
-            except ImportError:
+            else:
                 logger.debug("⚠️ psutilNot installed，Unable to checkGitprocess")
 
-            # 4. Explicitly close any file handle
-            try:
-                import gc
-
+            # 5. Explicitly close any file handle（onlyWindowsNeed to release handle）
+            if sys.platform == "win32":
                 gc.collect()
-            except:
-                pass
 
             logger.debug(f"✅ GitWarehouse cleaning completed")
             return {
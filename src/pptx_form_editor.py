@@ -1,20 +1,140 @@
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from lxml import etree
 import uuid
 import json
 import datetime
-import base64
+import logging
+import binascii
+import operator
 import os
+import traceback
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from src.utils import logger
+from src.template_loader import template_loader
 
 import re
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Multi-process extraction process pool（Created on first use，Reused across extractions）
+_EXTRACT_POOL = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+
+def _get_extract_pool(max_workers):
+    """Get the shared extraction pool（spawn start：never fork the threaded server）"""
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None:
+            _EXTRACT_POOL = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _EXTRACT_POOL
+
+
+def _discard_extract_pool(pool):
+    """Drop a broken process pool，Recreate it on next use"""
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is pool:
+            _EXTRACT_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# shapeIDFormat：slide_<Slide index>_shape_<shape index>
+_SHAPE_ID_RE = re.compile(r"^slide_(\d+)_shape_(\d+)$")
+
+
+def _parse_shape_id(shape_id):
+    """parse shapeID，return (slide_idx, shape_idx)，Returned if format does not match None"""
+    match = _SHAPE_ID_RE.match(shape_id)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+# Paragraph font properties（Read it all at once）
+_FONT_GETTER = operator.attrgetter("bold", "italic", "size", "name")
+
+# Color properties table：(Attribute name, output key, conversion function)
+_COLOR_FIELDS = (
+    ("theme_color", "theme_color", str),
+    ("brightness", "brightness", None),
+    ("type", "color_type", str),
+)
+
+# Color string parsing：RGB(r, g, b)
+_RGB_RE = re.compile(r"RGB\((\d+),\s*(\d+),\s*(\d+)\)")
+
+# Default for common theme colors RGB（Can be customized according to the template）
+_THEME_TO_RGB = {
+    "ACCENT_1": "#4F81BD",  # Blue
+    "ACCENT_2": "#C0504D",  # Red
+    "ACCENT_3": "#9BBB59",  # Green
+    "ACCENT_4": "#8064A2",  # Purple
+    "ACCENT_5": "#4BACC6",  # Light Blue
+    "ACCENT_6": "#F79646",  # Orange
+    "DARK_1": "#000000",  # Black
+    "DARK_2": "#1F497D",  # Dark Blue
+    "LIGHT_1": "#FFFFFF",  # White
+    "LIGHT_2": "#EEECE1",  # Light Gray
+}
+
+_MISSING = object()
+
+# The basic type that can be serialized directly（Exact type matching，Not included int Subclass）
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# shape Class capability cache：type -> (text_frame, has_table, text)
+_SHAPE_CAPS = {}
+
+
+def _shape_caps(shape):
+    """Get shape Class capability bits（Probe only once per class）"""
+    cls = type(shape)
+    caps = _SHAPE_CAPS.get(cls)
+    if caps is None:
+        caps = (
+            hasattr(cls, "text_frame"),
+            hasattr(cls, "has_table"),
+            hasattr(cls, "text"),
+        )
+        _SHAPE_CAPS[cls] = caps
+    return caps
+
+
+def _json_default(obj):
+    """orjson Unsupported type conversion（like RGBColor wait tuple Subclass）"""
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj):
+    """compactJSONserialization（priority use orjson）"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, default=_json_default).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
 
 class TextCleaner:
     """text border cleaner - Specially handledPPTXboundary characters in"""
 
-    # Define boundary characters（Newlines, spaces, tabs, etc.）
-    BOUNDARY_CHARS = r"[\n\r\t\f\v\u200b\u200c\u200d\u2060\s]*"
+    # Define boundary characters（Newlines, spaces, tabs, zero-width characters, etc.）
+    # with regular \s Consistent：include all str.isspace() character（Maximum code point U+3000）
+    BOUNDARY_SET = "".join(
+        ch for ch in map(chr, range(0x3001)) if ch.isspace()
+    ) + "\u200b\u200c\u200d\u2060"
 
     @staticmethod
     def strip_boundary(text):
@@ -22,18 +142,19 @@ class TextCleaner:
         if not text:
             return "", "", ""
 
-        # Match front boundary
-        leading_match = re.match(f"^{TextCleaner.BOUNDARY_CHARS}", text)
-        leading = leading_match.group() if leading_match else ""
+        chars = TextCleaner.BOUNDARY_SET
+
+        # Common situation：No boundary characters at either end，Return directly without slicing
+        if text[0] not in chars and text[-1] not in chars:
+            return text, "", ""
 
-        # Match back boundary
-        trailing_match = re.search(f"{TextCleaner.BOUNDARY_CHARS}$", text)
-        trailing = trailing_match.group() if trailing_match else ""
+        # Match front boundary
+        rest = text.lstrip(chars)
+        leading = text[: len(text) - len(rest)]
 
-        # Extract core text
-        start = len(leading)
-        end = len(text) - len(trailing)
-        core_text = text[start:end]
+        # Extract core text，The rest is the back boundary
+        core_text = rest.rstrip(chars)
+        trailing = rest[len(core_text) :]
 
         return core_text, leading, trailing
 
@@ -44,9 +165,95 @@ class TextCleaner:
 
 
 class PPTXFormEditor:
+    # Number of threads for writing images in parallel during extraction
+    IMAGE_WRITE_WORKERS = 8
+
+    # saveslideNumber of threads for files
+    SLIDE_WRITE_WORKERS = 8
+
+    # Number of threads for reading replacement images in parallel when applying images
+    IMAGE_READ_WORKERS = 8
+
+    # Multi-process extraction：Number of slides to enable、Minimum number of pages per process、Maximum number of processes
+    PARALLEL_MIN_SLIDES = 60
+    PARALLEL_MIN_SLIDES_PER_WORKER = 30
+    PARALLEL_MAX_WORKERS = 4
+
+    # Map numeric types to readable names
+    _TYPE_MAPPING = {
+        13: "picture",  # picture
+        14: "placeholder",  # placeholder
+        17: "textbox",  # text box
+        19: "table",  # sheet
+        1: "autoshape",  # automatic shape
+        6: "group",  # combination
+        9: "line",  # line
+        3: "chart",  # chart
+        5: "media",  # media
+        8: "smartart",  # SmartArt
+        18: "ole_object",  # OLEobject
+    }
+
+    # Text-related shape types：placeholder、text box、automatic shape（may contain text）
+    _TEXT_SHAPE_TYPES = frozenset({14, 17, 1})
+
+    # Non-text shape types：picture、combination、line、chart、media、SmartArt、OLEobject、sheet
+    _NON_TEXT_SHAPE_TYPES = frozenset({13, 6, 9, 3, 5, 8, 18, 19})
+
+    # Image shape name keywords
+    _PIC_NAME_KEYWORDS = ("picture", "image", "photo", "img")
+
+    # data URI prefix for common image types
+    _DATA_URI_PREFIX = {
+        "image/png": b"data:image/png;base64,",
+        "image/jpeg": b"data:image/jpeg;base64,",
+        "image/gif": b"data:image/gif;base64,",
+        "image/bmp": b"data:image/bmp;base64,",
+    }
+
+    # Placeholder text（Skip when applying changes）
+    PLACEHOLDER_PATTERNS = [
+        "[placeholder]",
+        "◇ shape",
+        "debug",
+        "No content",
+        "placeholder",
+        "shape",
+    ]
+    _PLACEHOLDER_RE = re.compile("|".join(map(re.escape, PLACEHOLDER_PATTERNS)))
+
+    # Editable text indicators（Compare after lowercase）
+    EDITABLE_INDICATORS = [
+        "Click to enter",
+        "Please enter",
+        "Fill in the content",
+        "Add title",
+        "Add text",
+        "subtitle",
+        "Click to add",
+        "Enter text",
+        "Add content",
+        "Title",
+        "Subtitle",
+        "Click to edit",
+        "Type here",
+        "Your text here",
+        "Text here",
+    ]
+    _EDITABLE_RE = re.compile(
+        "|".join(re.escape(indicator.lower()) for indicator in EDITABLE_INDICATORS)
+    )
+
     def __init__(self, pptx_path):
         self.pptx_path = pptx_path
 
+        # Image write queue（Only valid during extraction）
+        self._image_executor = None
+        self._pending_image_writes = []
+
+        # Run format cache：rPr XML -> Format dictionary（Same format runs extracted only once）
+        self._fmt_cache = {}
+
     def extract_editable_content(self, assets_dir=None):
         """extractPPTXContent and identifies editable areas
 
@@ -58,15 +265,65 @@ class PPTXFormEditor:
             prs = Presentation(self.pptx_path)
             logger.debug(f"turn up {len(prs.slides)} slides")
 
+            total_slides = len(prs.slides)
             content_structure = {
                 "slides": [],
                 "session_id": str(uuid.uuid4()),
-                "total_slides": len(prs.slides),
+                "total_slides": total_slides,
                 "images": {},  # New：Store all picture information
             }
 
-            for slide_idx, slide in enumerate(prs.slides):
-                logger.debug(f"processing section {slide_idx + 1} slides...")
+            # Large files are extracted in parallel in slide blocks，Return on failure None Then go serial
+            result = None
+            if total_slides >= self.PARALLEL_MIN_SLIDES:
+                result = self._extract_slides_parallel(total_slides, assets_dir)
+            if result is None:
+                result = self._extract_slides(prs, range(total_slides), assets_dir)
+
+            content_structure["slides"], content_structure["images"] = result
+
+            # 🔧 debug：Check image references（Only traverse when debugging is turned on）
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔍 Check image citation information:")
+                for slide_data in content_structure["slides"]:
+                    for shape in slide_data["shapes"]:
+                        if shape.get("has_image"):
+                            logger.debug(
+                                "  Picture shape %s: image_ref=%s, has_image_data=%s",
+                                shape["id"],
+                                shape.get("image_ref"),
+                                bool(shape.get("image_data")),
+                            )
+            return content_structure
+        except Exception as e:
+            logger.debug(f"Parse error: {e}")
+            traceback.print_exc()
+            return {"slides": [], "session_id": str(uuid.uuid4()), "total_slides": 0}
+
+    def _extract_slides(self, prs, slide_indices, assets_dir=None):
+        """Extract the specified slide
+
+        Args:
+            prs: Opened Presentation
+            slide_indices: Slide index to extract
+            assets_dir: Picture saving directory
+
+        Returns:
+            (slidesList, imagesdictionary)
+        """
+        slides = []
+        images = {}
+
+        # Images are written to disk in the background，Wait uniformly after slide loop
+        if assets_dir:
+            self._image_executor = ThreadPoolExecutor(
+                max_workers=self.IMAGE_WRITE_WORKERS
+            )
+
+        try:
+            for slide_idx in slide_indices:
+                slide = prs.slides[slide_idx]
+                logger.debug("processing section %d slides...", slide_idx + 1)
                 slide_data = {
                     "slide_number": slide_idx + 1,
                     "layout": slide.slide_layout.name,
@@ -90,36 +347,78 @@ class PPTXFormEditor:
                         # 🔧 Record picture information
                         if shape_info.get("has_image") and shape_info.get("image_ref"):
                             image_id = f"slide_{slide_idx}_image_{shape_idx}"
-                            content_structure["images"][image_id] = {
+                            images[image_id] = {
                                 "shape_id": shape_info["id"],
                                 "filename": shape_info.get("image_ref"),
                                 "info": shape_info.get("image_info", {}),
                             }
 
                         logger.debug(
-                            f"  find shape {shape_idx}: {shape_info['type']} - '{shape_info.get('text', '')[:30]}...'"
+                            "  find shape %s: %s - '%.30s...'",
+                            shape_idx,
+                            shape_info["type"],
+                            shape_info.get("text", ""),
                         )
 
-                content_structure["slides"].append(slide_data)
+                slides.append(slide_data)
                 logger.debug(
-                    f"No. {slide_idx + 1} slides found {len(slide_data['shapes'])} shapes"
+                    "No. %d slides found %d shapes",
+                    slide_idx + 1,
+                    len(slide_data["shapes"]),
                 )
+        finally:
+            self._flush_image_writes()
 
-            # 🔧 debug：Check image references
-            logger.debug("🔍 Check image citation information:")
-            for slide_data in content_structure["slides"]:
-                for shape in slide_data["shapes"]:
-                    if shape.get("has_image"):
-                        logger.debug(
-                            f"  Picture shape {shape['id']}: image_ref={shape.get('image_ref')}, has_image_data={bool(shape.get('image_data'))}"
-                        )
-            return content_structure
-        except Exception as e:
-            logger.debug(f"Parse error: {e}")
-            import traceback
+        return slides, images
 
-            traceback.print_exc()
-            return {"slides": [], "session_id": str(uuid.uuid4()), "total_slides": 0}
+    def _extract_slides_parallel(self, total_slides, assets_dir=None):
+        """Extract slides in parallel using multiple processes（Each process opens the file once，Process a continuous slide）
+
+        Args:
+            total_slides: Total number of slides
+            assets_dir: Picture saving directory
+
+        Returns:
+            (slidesList, imagesdictionary)，Return if unavailable or failed None
+        """
+        workers = min(
+            os.cpu_count() or 1,
+            self.PARALLEL_MAX_WORKERS,
+            total_slides // self.PARALLEL_MIN_SLIDES_PER_WORKER,
+        )
+        if workers < 2:
+            return None
+
+        # Divide slides into contiguous blocks
+        chunk_size = -(-total_slides // workers)
+        chunks = [
+            range(start, min(start + chunk_size, total_slides))
+            for start in range(0, total_slides, chunk_size)
+        ]
+
+        pool = _get_extract_pool(self.PARALLEL_MAX_WORKERS)
+        try:
+            logger.debug(
+                "⚡ Parallel extraction: %d slides, %d process", total_slides, len(chunks)
+            )
+            futures = [
+                pool.submit(_extract_slides_worker, self.pptx_path, chunk, assets_dir)
+                for chunk in chunks
+            ]
+            slides = []
+            images = {}
+            for future in futures:
+                chunk_slides, chunk_images = future.result()
+                slides.extend(chunk_slides)
+                images.update(chunk_images)
+            return slides, images
+        except BrokenProcessPool as e:
+            _discard_extract_pool(pool)
+            logger.debug("⚠️ Extraction process pool broken，fallback serial: %s", e)
+            return None
+        except Exception as e:
+            logger.debug("⚠️ Parallel extraction failed，fallback serial: %s", e)
+            return None
 
     def _extract_shape_info(
         self, shape, slide_idx, shape_idx, parent_group=None, assets_dir=None
@@ -132,26 +431,34 @@ class PPTXFormEditor:
             shape_name = getattr(shape, "name", f"shape_{shape_idx}")
             shape_type = self._get_shape_type_name(shape)
 
-            logger.debug(f"    Work with shapes: {shape_name}, type: {shape_type}")
+            logger.debug("    Work with shapes: %s, type: %s", shape_name, shape_type)
+
+            # Get detailed location and size information（Read at once，Use default value on failure）
+            try:
+                left, top = int(shape.left), int(shape.top)
+                width, height = int(shape.width), int(shape.height)
+            except (AttributeError, TypeError):
+                left, top, width, height = 100, 100, 200, 50
+
+            try:
+                rotation = shape.rotation
+            except AttributeError:
+                rotation = 0
 
-            # Get detailed location and size information
             shape_info = {
                 "id": shape_id,
                 "type": shape_type,
                 "name": shape_name,
                 "parent_group": parent_group,  # record parent combination
-                "left": int(shape.left) if hasattr(shape, "left") else 100,
-                "top": int(shape.top) if hasattr(shape, "top") else 100,
-                "width": int(shape.width) if hasattr(shape, "width") else 200,
-                "height": int(shape.height) if hasattr(shape, "height") else 50,
-                "rotation": getattr(shape, "rotation", 0),
+                "left": left,
+                "top": top,
+                "width": width,
+                "height": height,
+                "rotation": rotation,
                 "z_order": shape_idx,
             }
             # Extract text content
-            text_obj = self._extract_text_content(shape)
-            shape_info["text"] = (
-                text_obj["paragraphs"] if "paragraphs" in text_obj else []
-            )
+            shape_info["text"] = self._extract_text_frame(shape)
 
             # 🔧 repair：Check if it is an image shape
             if self._is_picture_shape(shape):
@@ -163,7 +470,7 @@ class PPTXFormEditor:
                     shape_info.update(picture_info)
 
             # Processing forms
-            elif hasattr(shape, "has_table") and shape.has_table:
+            elif getattr(shape, "has_table", False):
                 table_info = self._extract_table_info(shape)
                 if table_info:
                     shape_info.update(table_info)
@@ -208,8 +515,6 @@ class PPTXFormEditor:
 
         except Exception as e:
             logger.debug(f"❌ Error in extracting shape information: {e}")
-            import traceback
-
             traceback.print_exc()
             return None
 
@@ -219,22 +524,8 @@ class PPTXFormEditor:
             raw_type = getattr(shape, "shape_type", "unknown")
 
             # Map numeric types to readable names
-            type_mapping = {
-                13: "picture",  # picture
-                14: "placeholder",  # placeholder
-                17: "textbox",  # text box
-                19: "table",  # sheet
-                1: "autoshape",  # automatic shape
-                6: "group",  # combination
-                9: "line",  # line
-                3: "chart",  # chart
-                5: "media",  # media
-                8: "smartart",  # SmartArt
-                18: "ole_object",  # OLEobject
-            }
-
             if isinstance(raw_type, int):
-                return type_mapping.get(raw_type, "unknown")
+                return self._TYPE_MAPPING.get(raw_type, "unknown")
             elif isinstance(raw_type, str):
                 # deal with "picture (13)" this situation
                 return raw_type.split("(")[0].strip().lower()
@@ -248,24 +539,17 @@ class PPTXFormEditor:
     def _is_picture_shape(self, shape):
         """Check whether it is an image shape"""
         try:
-            # method1：examineshape_type
-            if hasattr(shape, "shape_type"):
-                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                    return True
+            # method1：examineshape_type（Cover almost all real pictures）
+            if getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.PICTURE:
+                return True
 
             # method2：Check if there isimageproperty
-            if hasattr(shape, "image") and shape.image:
+            if getattr(shape, "image", None):
                 return True
 
             # method3：Check if the name contains image keywords
             shape_name = getattr(shape, "name", "").lower()
-            if any(
-                keyword in shape_name
-                for keyword in ["picture", "image", "photo", "img"]
-            ):
-                return True
-
-            return False
+            return any(keyword in shape_name for keyword in self._PIC_NAME_KEYWORDS)
         except:
             return False
 
@@ -290,19 +574,19 @@ class PPTXFormEditor:
             }
             extension = ext_map.get(content_type, ".png")
 
-            # Generate unique file name
-            import hashlib
-            import uuid
-
-            # Use content hashing + UUID ensure uniqueness
-            content_hash = hashlib.md5(image_blob).hexdigest()[:8]
-            unique_id = str(uuid.uuid4())[:8]
+            # Generate file name（Slide index + Shape index is unique）
             filename = f"img_{slide_idx}_{shape_idx}{extension}"
 
-            # Save picture file
+            # Save picture file（There is a write queue and it is submitted to the background thread）
             image_path = os.path.join(assets_dir, filename)
-            with open(image_path, "wb") as f:
-                f.write(image_blob)
+            if self._image_executor is not None:
+                self._pending_image_writes.append(
+                    self._image_executor.submit(
+                        self._write_image_file, image_path, image_blob
+                    )
+                )
+            else:
+                self._write_image_file(image_path, image_blob)
 
             # Return picture information
             return {
@@ -323,6 +607,42 @@ class PPTXFormEditor:
             logger.debug(f"❌ Failed to save image: {e}")
             return None
 
+    @staticmethod
+    def _write_image_file(image_path, image_blob):
+        """Write image data to file（Write directly to file descriptor，No buffer layer）"""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(image_path, flags, 0o644)
+        try:
+            view = memoryview(image_blob)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        return image_path
+
+    def _flush_image_writes(self):
+        """Wait for all background image writes to complete and close the write queue"""
+        executor = self._image_executor
+        if executor is None:
+            return
+
+        failed = 0
+        for future in self._pending_image_writes:
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                logger.debug(f"❌ Failed to save image: {e}")
+
+        executor.shutdown(wait=True)
+        logger.debug(
+            f"💾 Image writing completed: {len(self._pending_image_writes) - failed}/{len(self._pending_image_writes)}"
+        )
+
+        self._image_executor = None
+        self._pending_image_writes = []
+
     def _extract_picture_info(
         self, shape, slide_idx=None, shape_idx=None, assets_dir=None
     ):
@@ -350,7 +670,9 @@ class PPTXFormEditor:
                             "filename"
                         ]  # Use saved file name
                         logger.debug(
-                            f"✅ save image: {saved_info['filename']} ({saved_info['size_bytes']} bytes)"
+                            "✅ save image: %s (%d bytes)",
+                            saved_info["filename"],
+                            saved_info["size_bytes"],
                         )
                     else:
                         # Save failed，Use base file name
@@ -365,7 +687,7 @@ class PPTXFormEditor:
                 # No save directory，Also set a reference
                 picture_info["image_ref"] = f"{base_filename}.jpg"
                 logger.debug(
-                    f"ℹ️ No save directory，Use references: {picture_info['image_ref']}"
+                    "ℹ️ No save directory，Use references: %s", picture_info["image_ref"]
                 )
 
             # Fallback tobase64coding（small picture），but keep the reference
@@ -373,11 +695,13 @@ class PPTXFormEditor:
                 try:
                     image_bytes = shape.image.blob
                     if image_bytes and len(image_bytes) < 1000000:  # 1MBthe following
-                        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
                         content_type = getattr(shape.image, "content_type", "image/png")
+                        prefix = self._DATA_URI_PREFIX.get(content_type)
+                        if prefix is None:
+                            prefix = f"data:{content_type};base64,".encode("ascii")
                         picture_info["image_data"] = (
-                            f"data:{content_type};base64,{image_base64}"
-                        )
+                            prefix + binascii.b2a_base64(image_bytes, newline=False)
+                        ).decode("ascii")
 
                         # Even if there isbase64data，Also keep file references
                         if not picture_info.get("image_ref"):
@@ -393,7 +717,9 @@ class PPTXFormEditor:
                 )
 
             logger.debug(
-                f"📸 Image information extraction completed: ref={picture_info['image_ref']}, has_data={bool(picture_info['image_data'])}"
+                "📸 Image information extraction completed: ref=%s, has_data=%s",
+                picture_info["image_ref"],
+                picture_info["image_data"] is not None,
             )
 
             return picture_info
@@ -436,30 +762,24 @@ class PPTXFormEditor:
             logger.debug(f"Error extracting chart information: {e}")
             return {"is_chart": True, "chart_error": str(e)}
 
-    def _extract_text_content(self, shape):
-        """Extract text content with full run-level structure preservation"""
-        # Extract from text frame with run preservation
-        if hasattr(shape, "text_frame"):
-            paragraphs_data = []
-            flat_text_parts = []
-            for para_idx, paragraph in enumerate(shape.text_frame.paragraphs):
-                para_data = {
-                    "paragraph_index": para_idx,
-                    "alignment": (
-                        str(paragraph.alignment) if paragraph.alignment else "left"
-                    ),
-                    "level": paragraph.level if hasattr(paragraph, "level") else 0,
-                    "font": self._extract_paragraph_font(
-                        paragraph
-                    ),  # New：paragraph level font
-                    "runs": [],
-                }
-
-                for run_idx, run in enumerate(paragraph.runs):
-                    # Extract detailedrunformat information
-                    core_text, leading, trailing = TextCleaner.strip_boundary(run.text)
+    def _extract_text_frame(self, shape):
+        """Extract text frame paragraphs with full run-level structure preservation
 
-                    run_data = {
+        Returns:
+            Paragraph list（no text frame returns empty list；Form content is provided by _extract_table_info extract）
+        """
+        if not hasattr(shape, "text_frame"):
+            return []
+
+        paragraphs_data = []
+        for para_idx, paragraph in enumerate(shape.text_frame.paragraphs):
+            runs_data = []
+            for run_idx, run in enumerate(paragraph.runs):
+                # Extract detailedrunformat information
+                core_text, leading, trailing = TextCleaner.strip_boundary(run.text)
+
+                runs_data.append(
+                    {
                         "run_index": run_idx,
                         "text": core_text,  # 🎯 Only store core text
                         "boundary": {  # 🎯 Store boundary information
@@ -469,26 +789,23 @@ class PPTXFormEditor:
                         "editable": self._is_editable_text(core_text),
                         "format": self._extract_run_format(run),
                     }
+                )
 
-                    para_data["runs"].append(run_data)
-
-                paragraphs_data.append(para_data)
-
-            # Store structured data on shape for later use
-            shape._pptxpress_paragraphs_data = paragraphs_data
-            # Return full hierarchy instead of flat text
-            return {
-                "type": "rich_text",
-                "paragraphs": paragraphs_data,
-                "shape_type": "text_frame",
-            }
-
-        # For tables, we also need to preserve run structure
-        if hasattr(shape, "has_table") and shape.has_table:
-            table_result = self._extract_table_content(shape.table)
-            return {"type": "table", "content": table_result}
+            paragraphs_data.append(
+                {
+                    "paragraph_index": para_idx,
+                    "alignment": (
+                        str(paragraph.alignment) if paragraph.alignment else "left"
+                    ),
+                    "level": paragraph.level if hasattr(paragraph, "level") else 0,
+                    "font": self._extract_paragraph_font(
+                        paragraph
+                    ),  # New：paragraph level font
+                    "runs": runs_data,
+                }
+            )
 
-        return {"type": "empty", "text": ""}
+        return paragraphs_data
 
     def _extract_paragraph_font(self, paragraph):
         """Extract paragraph-level font formatting"""
@@ -498,10 +815,12 @@ class PPTXFormEditor:
             # Paragraphs may also have font settings（as default）
             if hasattr(paragraph, "font"):
                 font = paragraph.font
-                font_data["bold"] = getattr(font, "bold", None)
-                font_data["italic"] = getattr(font, "italic", None)
-                font_data["size"] = getattr(font, "size", None)
-                font_data["name"] = getattr(font, "name", None)
+                (
+                    font_data["bold"],
+                    font_data["italic"],
+                    font_data["size"],
+                    font_data["name"],
+                ) = _FONT_GETTER(font)
                 font_data["color"] = self._extract_color(getattr(font, "color", None))
         except:
             pass
@@ -517,23 +836,18 @@ class PPTXFormEditor:
 
         try:
             # RGBcolor
-            if hasattr(color_obj, "rgb"):
-                color_info["rgb"] = color_obj.rgb
+            rgb = getattr(color_obj, "rgb", _MISSING)
+            if rgb is not _MISSING:
+                color_info["rgb"] = rgb
                 # Convert to hexadecimal
-                if color_obj.rgb:
-                    color_info["hex"] = f"#{color_obj.rgb:06X}"
-
-            # theme color
-            if hasattr(color_obj, "theme_color"):
-                color_info["theme_color"] = str(color_obj.theme_color)
+                if rgb:
+                    color_info["hex"] = f"#{rgb:06X}"
 
-            # Brightness adjustment
-            if hasattr(color_obj, "brightness"):
-                color_info["brightness"] = color_obj.brightness
-
-            # color type
-            if hasattr(color_obj, "type"):
-                color_info["color_type"] = str(color_obj.type)
+            # theme color、Brightness adjustment、color type（Each attribute is only read once）
+            for attr, key, convert in _COLOR_FIELDS:
+                value = getattr(color_obj, attr, _MISSING)
+                if value is not _MISSING:
+                    color_info[key] = convert(value) if convert else value
 
         except Exception as e:
             color_info["error"] = str(e)
@@ -556,7 +870,7 @@ class PPTXFormEditor:
                         {"text": cell_text.strip(), "row": row_idx, "col": cell_idx}
                     )
                 table_data.append(row_data)
-            return json.dumps(table_data, ensure_ascii=False)
+            return _dumps(table_data)
         except Exception as e:
             logger.debug(f"Extract form error: {e}")
             return "[]"
@@ -566,28 +880,9 @@ class PPTXFormEditor:
         if not text.strip():
             return True
 
-        editable_indicators = [
-            "Click to enter",
-            "Please enter",
-            "Fill in the content",
-            "Add title",
-            "Add text",
-            "subtitle",
-            "Click to add",
-            "Enter text",
-            "Add content",
-            "Title",
-            "Subtitle",
-            "Click to edit",
-            "Type here",
-            "Your text here",
-            "Text here",
-        ]
-
         # Short text or text containing indicators can be edited
-        text_lower = text.lower()
-        return len(text.strip()) < 10 or any(
-            indicator.lower() in text_lower for indicator in editable_indicators
+        return len(text.strip()) < 10 or bool(
+            self._EDITABLE_RE.search(text.lower())
         )
 
     def generate_editable_html(self, content_structure):
@@ -616,22 +911,25 @@ class PPTXFormEditor:
     def _generate_javascript_data(self, content_structure):
         """generateJavaScriptinitialization data"""
         try:
-            # compactJSONFormat
-            slides_data_json = json.dumps(
-                content_structure["slides"], ensure_ascii=False, separators=(",", ":")
+            # Front and rear fixed fragments，The middle is splicedJSON（Don't go f-string Copy the big string again）
+            prefix = "\n// Initialize editor data\nwindow.editorData = {\n    slidesData: "
+            suffix = (
+                f',\n    sessionId: "{content_structure["session_id"]}",'
+                f"\n    totalSlides: {content_structure['total_slides']}\n}};"
+                '\nconsole.log("✅ Data setting completed");\n'
             )
 
-            js_code = f"""
-            // Initialize editor data
-            window.editorData = {{
-                slidesData: {slides_data_json},
-                sessionId: "{content_structure['session_id']}",
-                totalSlides: {content_structure['total_slides']}
-            }};
-            console.log("✅ Data setting completed");
-            """
+            if _HAS_ORJSON:
+                # orjson output bytes，Decode only once after splicing
+                return b"".join(
+                    (
+                        prefix.encode("utf-8"),
+                        orjson.dumps(content_structure["slides"], default=_json_default),
+                        suffix.encode("utf-8"),
+                    )
+                ).decode("utf-8")
 
-            return js_code
+            return "".join((prefix, _dumps(content_structure["slides"]), suffix))
 
         except Exception as e:
             logger.debug(f"❌ generateJavaScriptData error: {e}")
@@ -645,10 +943,17 @@ class PPTXFormEditor:
 
         logger.debug(f"🔄 Start applying {len(changes)} Modify everywhere...")
 
+        # Each slide's shape list is enumerated only once
+        shapes_cache = {}
+
         applied_count = 0
         for shape_id, new_text in changes.items():
             if self._apply_single_change(
-                presentation, shape_id, new_text, content_structure
+                presentation,
+                shape_id,
+                new_text,
+                content_structure,
+                shapes_cache=shapes_cache,
             ):
                 applied_count += 1
 
@@ -657,9 +962,13 @@ class PPTXFormEditor:
         )
 
     def _apply_single_change(
-        self, presentation, shape_id, change_data, content_structure
+        self, presentation, shape_id, change_data, content_structure, shapes_cache=None
     ):
-        """Apply single modification"""
+        """Apply single modification
+
+        Args:
+            shapes_cache: optional {slide_idx: [shape, ...]} cache，Shared by batch calls
+        """
         try:
             # 🔧 repair：Processing dictionary formatchange_data
             if isinstance(change_data, dict):
@@ -675,32 +984,31 @@ class PPTXFormEditor:
                 return False
 
             # Filter placeholder text
-            placeholder_patterns = [
-                "[placeholder]",
-                "◇ shape",
-                "debug",
-                "No content",
-                "placeholder",
-                "shape",
-            ]
-            if any(pattern in new_text for pattern in placeholder_patterns):
+            if self._PLACEHOLDER_RE.search(new_text):
                 logger.debug(
                     f"⏭️ Skip placeholder text: {shape_id} -> '{new_text[:50]}...'"
                 )
                 return False
 
             # Analyze shapesID
-            parts = shape_id.split("_")
-            if len(parts) >= 4 and parts[0] == "slide" and parts[2] == "shape":
-                slide_idx = int(parts[1])
-                shape_idx = int(parts[3])
+            parsed = _parse_shape_id(shape_id)
+            if parsed:
+                slide_idx, shape_idx = parsed
 
                 # Verify index
                 if 0 <= slide_idx < len(presentation.slides):
-                    slide = presentation.slides[slide_idx]
+                    shapes = (
+                        shapes_cache.get(slide_idx)
+                        if shapes_cache is not None
+                        else None
+                    )
+                    if shapes is None:
+                        shapes = list(presentation.slides[slide_idx].shapes)
+                        if shapes_cache is not None:
+                            shapes_cache[slide_idx] = shapes
 
-                    if 0 <= shape_idx < len(slide.shapes):
-                        shape = slide.shapes[shape_idx]
+                    if 0 <= shape_idx < len(shapes):
+                        shape = shapes[shape_idx]
 
                         # 🔧 repair：Check if the text shape is editable
                         if not self._is_text_shape(shape):
@@ -726,8 +1034,6 @@ class PPTXFormEditor:
 
         except Exception as e:
             logger.debug(f"❌ Applying changes failed {shape_id}: {e}")
-            import traceback
-
             traceback.print_exc()
 
         return False
@@ -737,15 +1043,8 @@ class PPTXFormEditor:
         try:
             shape_type = getattr(shape, "shape_type", None)
 
-            # Text-related shape types
-            text_shape_types = [
-                14,  # placeholder PLACEHOLDER
-                17,  # text box TEXT_BOX
-                1,  # automatic shape（may contain text）AUTO_SHAPE
-            ]
-
             # method1：Check shape type
-            if shape_type in text_shape_types:
+            if shape_type in self._TEXT_SHAPE_TYPES:
                 return True
 
             # method2：Check if there is a text frame
@@ -762,18 +1061,7 @@ class PPTXFormEditor:
                 return True
 
             # Non-text shape types
-            non_text_shape_types = [
-                13,  # picture PICTURE
-                6,  # combination GROUP
-                9,  # line LINE
-                3,  # chart CHART
-                5,  # media MEDIA
-                8,  # SmartArt SMART_ART
-                18,  # OLEobject OLE_OBJECT
-                19,  # sheet TABLE
-            ]
-
-            if shape_type in non_text_shape_types:
+            if shape_type in self._NON_TEXT_SHAPE_TYPES:
                 return False
 
             # Not modified by default
@@ -786,13 +1074,15 @@ class PPTXFormEditor:
     def _update_shape_content(self, shape, new_text):
         """Update shape content"""
         try:
+            has_text_frame, has_table_attr, has_text = _shape_caps(shape)
+
             # text frame shape（Text boxes, placeholders, etc.）
-            if hasattr(shape, "text_frame") and shape.text_frame:
+            if has_text_frame and shape.text_frame:
                 self._update_text_frame(shape.text_frame, new_text)
                 return True
 
             # table shape
-            elif hasattr(shape, "has_table") and shape.has_table:
+            elif has_table_attr and shape.has_table:
                 # Table modification requires special handling，Simplified processing here
                 logger.debug(
                     f"📊 Table modification requires special handling: {shape.name}"
@@ -800,7 +1090,7 @@ class PPTXFormEditor:
                 return False
 
             # Auto shapes may contain text
-            elif hasattr(shape, "text"):
+            elif has_text:
                 shape.text = new_text
                 return True
 
@@ -814,22 +1104,32 @@ class PPTXFormEditor:
 
     def _update_text_frame(self, text_frame, new_text):
         """Update text frame content"""
-        # Clear all existing text
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                run.text = ""
+        paragraphs = list(text_frame.paragraphs)
 
         # If there is a paragraph，Add new text using first paragraph
-        if text_frame.paragraphs:
-            first_paragraph = text_frame.paragraphs[0]
-            if first_paragraph.runs:
-                first_paragraph.runs[0].text = new_text
+        if paragraphs:
+            # Only the first one is retainedRun：Remove the rest directly <a:r> element（Instead of clearing them one by one）
+            first_runs = list(paragraphs[0].runs)
+            for paragraph in paragraphs[1:]:
+                for run in paragraph.runs:
+                    self._remove_run(run)
+            for run in first_runs[1:]:
+                self._remove_run(run)
+
+            if first_runs:
+                first_runs[0].text = new_text
             else:
-                first_paragraph.add_run().text = new_text
+                paragraphs[0].add_run().text = new_text
         else:
             # if there is no paragraph，create new
             text_frame.paragraphs[0].add_run().text = new_text
 
+    @staticmethod
+    def _remove_run(run):
+        """from XML Remove one from Run"""
+        r = run._r
+        r.getparent().remove(r)
+
     def extract_for_project_init(self, project_dir: str = None) -> dict:
         """
         Extract data specifically for project initialization，Returns all required formats.
@@ -864,9 +1164,9 @@ class PPTXFormEditor:
                 }
 
             # 2. Generate data in various formats
-            editor_format = self._to_editor_format(raw_content)
-            slide_files_data = self._to_slide_files_data(raw_content)
-            slides_info = self._to_slides_info(slide_files_data)
+            editor_format, slide_files_data, slides_info = self._build_all_formats(
+                raw_content
+            )
             logger.debug(f"✅ Extraction completed:")
             logger.debug(
                 f"   - original content: {len(raw_content.get('slides', []))} slides"
@@ -890,8 +1190,6 @@ class PPTXFormEditor:
 
         except Exception as e:
             logger.debug(f"❌ Failed to extract project initialization data: {e}")
-            import traceback
-
             traceback.print_exc()
             return {
                 "raw_content": {"slides": []},
@@ -901,27 +1199,42 @@ class PPTXFormEditor:
                 "images_info": {},
             }
 
-    def _to_editor_format(self, raw_content: dict) -> dict:
+    def _build_all_formats(self, raw_content: dict) -> tuple:
         """
-        Convert raw content into the format expected by the front-end editor.
+        Traverse the original content once，At the same time, the front-end editor format is generated、slideFile data andproject.yamlslideinformation.
 
         Args:
             raw_content: extract_editable_content() return value
 
         Returns:
-            dict: Front-end editor format
+            tuple: (editor_format, slide_files_data, slides_info)
         """
         editor_slides = []
+        slide_files_data = []
+        slides_info = []
 
-        for slide_data in raw_content.get("slides", []):
+        # All shapes of this extraction share the same modification time
+        now_iso = datetime.datetime.now().isoformat()
+
+        for slide_idx, slide_data in enumerate(raw_content.get("slides", [])):
             slide_obj = {
                 "slide_number": slide_data.get("slide_number", 0),
                 "shapes": [],
             }
+            slide_id = f"slide_{slide_idx:03d}"
+            shapes_data = {}
 
             for shape in slide_data.get("shapes", []):
+                # Both formats share these fields，Only look up once
+                shape_id = shape.get("id", "")
+                is_table = shape.get("is_table")
+                has_image = shape.get("has_image")
+                image_ref = shape.get("image_ref")
+                image_info = shape.get("image_info")
+
+                # 1. Front-end editor format
                 shape_obj = {
-                    "id": shape.get("id", ""),
+                    "id": shape_id,
                     "type": shape.get("type", "placeholder"),
                     "name": shape.get("name", ""),
                     "text": shape.get("text", ""),
@@ -932,74 +1245,52 @@ class PPTXFormEditor:
                     "editable": shape.get("editable", True),
                 }
 
-                if shape.get("is_table"):
+                if is_table:
                     shape_obj["is_table"] = True
                     shape_obj["table_data"] = shape.get("table_data", "[]")
                 # 🔧 critical fix：Pass image reference information
-                if shape.get("has_image"):
+                if has_image:
                     shape_obj["has_image"] = True
                     shape_obj["image_data"] = shape.get("image_data")
 
                     # 🔧 transfer image_ref
-                    if shape.get("image_ref"):
-                        shape_obj["image_ref"] = shape.get("image_ref")
-                    elif shape.get("image_info") and shape.get("image_info").get(
-                        "filename"
-                    ):
+                    if image_ref:
+                        shape_obj["image_ref"] = image_ref
+                    elif image_info:
                         # from image_info Get the file name in
-                        shape_obj["image_ref"] = shape.get("image_info").get("filename")
+                        filename = image_info.get("filename")
+                        if filename:
+                            shape_obj["image_ref"] = filename
 
                 slide_obj["shapes"].append(shape_obj)
 
-            editor_slides.append(slide_obj)
-
-        return {"slides": editor_slides}
-
-    def _to_slide_files_data(self, raw_content: dict) -> list:
-        """
-        Convert original content toslideFile data format.
-
-        Args:
-            raw_content: extract_editable_content() return value
-
-        Returns:
-            list: slideFile data list
-        """
-        slide_files_data = []
-
-        for slide_idx, slide_data in enumerate(raw_content.get("slides", [])):
-            slide_id = f"slide_{slide_idx:03d}"
-            shapes_data = {}
-
-            # Process each shape
-            for shape in slide_data.get("shapes", []):
-                shape_id = shape.get("id", "")
-                shape_type_abbr = self._get_shape_type_abbr(shape)
-
+                # 2. slideFile data format
                 shape_entry = {
-                    "t": shape_type_abbr,
-                    "mod": datetime.datetime.now().isoformat(),
+                    "t": self._get_shape_type_abbr(shape),
+                    "mod": now_iso,
                 }
 
                 # If it is a picture，Record picture information
-                if shape.get("is_table"):
+                if is_table:
                     shape_entry["t"] = "table"
                     shape_entry["is_table"] = True
                     shape_entry["table_data"] = shape.get(
                         "table_data", "[]"
                     )  # 🎯 JSON str
-                elif shape.get("has_image"):
+                elif has_image:
                     shape_entry["type"] = "image"
-                    if shape.get("image_ref"):
-                        shape_entry["image_ref"] = shape.get("image_ref")
-                    if shape.get("image_info"):
-                        shape_entry["image_info"] = shape.get("image_info")
+                    if image_ref:
+                        shape_entry["image_ref"] = image_ref
+                    if image_info:
+                        shape_entry["image_info"] = image_info
                 else:
                     # text shape
                     shape_entry["txt"] = shape.get("text", "")
 
                 shapes_data[shape_id] = shape_entry
 
+            editor_slides.append(slide_obj)
+
             # Extract title
             title = self._extract_slide_title(shapes_data)
 
@@ -1012,30 +1303,18 @@ class PPTXFormEditor:
                 }
             )
 
-        return slide_files_data
-
-    def _to_slides_info(self, slide_files_data: list) -> list:
-        """
-        fromslideFile data is extracted forproject.yamlinformation.
-
-        Args:
-            slide_files_data: _to_slide_files_data() return value
-
-        Returns:
-            list: used forproject.yamlofslideInformation list
-        """
-        slides_info = []
-
-        for slide_data in slide_files_data:
+            # 3. used forproject.yamlofslideinformation
             slides_info.append(
                 {
-                    "id": slide_data["slide_id"],
-                    "file": f"slides/{slide_data['slide_id']}.json",
-                    "title": slide_data["title"][:50],  # Limit title length
+                    "id": slide_id,
+                    "file": f"slides/{slide_id}.json",
+                    "title": (
+                        title if len(title) <= 50 else title[:50]
+                    ),  # Limit title length
                 }
             )
 
-        return slides_info
+        return {"slides": editor_slides}, slide_files_data, slides_info
 
     def _get_shape_type_abbr(self, shape: dict) -> str:
         """
@@ -1072,23 +1351,28 @@ class PPTXFormEditor:
         if not shapes_data:
             return ""
 
-        # First find the shape of the title type
-        for shape_id, shape_info in shapes_data.items():
-            if shape_info.get("t") == "ttl":
-                title = shape_info.get("txt", "")
-                if title.strip():
-                    return title
+        # One pass：first non-empty title wins，remember first non-empty text as fallback
+        first_txt = ""
+        for shape_info in shapes_data.values():
+            txt = shape_info.get("txt")
+            if not txt:
+                continue
+            if shape_info.get("t") == "ttl" and (
+                txt.strip() if isinstance(txt, str) else txt
+            ):
+                return txt
+            if not first_txt:
+                first_txt = txt
 
-        # if title not found，Get the contents of the first text box
-        first_shape = next(iter(shapes_data.values()), {})
-        return first_shape.get("txt", "")
+        # if title not found，Use the first shape with text（Skip pictures/sheet）
+        return first_txt
 
     def save_slide_files(self, slide_files_data: list, output_dir: str) -> bool:
         """
         saveslidefile to the specified directory.
 
         Args:
-            slide_files_data: _to_slide_files_data() return value
+            slide_files_data: _build_all_formats() returned slide_files_data
             output_dir: Output directory（Project directory）
 
         Returns:
@@ -1097,7 +1381,10 @@ class PPTXFormEditor:
         try:
             slides_dir = os.path.join(output_dir, "slides")
             os.makedirs(slides_dir, exist_ok=True)
+            # slide_id No path separator，Splice the prefix directly
+            slides_prefix = slides_dir + os.sep
 
+            jobs = []
             for slide_data in slide_files_data:
                 slide_id = slide_data["slide_id"]
                 slide_json = {
@@ -1114,12 +1401,17 @@ class PPTXFormEditor:
                                 shape_info["table_data"], ensure_ascii=False
                             )
 
-                # save asJSONdocument
-                slide_path = os.path.join(slides_dir, f"{slide_id}.json")
-                with open(slide_path, "w", encoding="utf-8") as f:
-                    json.dump(slide_json, f, separators=(",", ":"), ensure_ascii=False)
+                slide_path = f"{slides_prefix}{slide_id}.json"
+                jobs.append((slide_path, slide_json))
 
-                logger.debug(f"💾 saveslidedocument: {slide_path}")
+            # save asJSONdocument（Multi-threaded parallel writing）
+            if jobs:
+                workers = min(self.SLIDE_WRITE_WORKERS, len(jobs))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for slide_path in executor.map(
+                        lambda job: self._write_slide_file(*job), jobs
+                    ):
+                        logger.debug("💾 saveslidedocument: %s", slide_path)
 
             logger.debug(
                 f"✅ Save completed: {len(slide_files_data)} indivualslidedocument"
@@ -1128,19 +1420,28 @@ class PPTXFormEditor:
 
         except Exception as e:
             logger.debug(f"❌ saveslideFile failed: {e}")
-            import traceback
-
             traceback.print_exc()
             return False
 
+    @staticmethod
+    def _write_slide_file(slide_path, slide_json):
+        """Write a singleslide JSONdocument"""
+        if _HAS_ORJSON:
+            # orjson Directly output compactUTF-8bytes
+            with open(slide_path, "wb") as f:
+                f.write(orjson.dumps(slide_json, default=_json_default))
+        else:
+            with open(slide_path, "w", encoding="utf-8") as f:
+                json.dump(slide_json, f, separators=(",", ":"), ensure_ascii=False)
+        return slide_path
+
     def apply_image_to_pptx(self, presentation, shape_id, image_path):
         """Apply image toPPTXspecified shape"""
         try:
             # Analyze shapesID
-            parts = shape_id.split("_")
-            if len(parts) >= 4 and parts[0] == "slide" and parts[2] == "shape":
-                slide_idx = int(parts[1])
-                shape_idx = int(parts[3])
+            parsed = _parse_shape_id(shape_id)
+            if parsed:
+                slide_idx, shape_idx = parsed
 
                 if 0 <= slide_idx < len(presentation.slides):
                     slide = presentation.slides[slide_idx]
@@ -1165,11 +1466,86 @@ class PPTXFormEditor:
             logger.debug(f"❌ Applying image failed: {e}")
             return False
 
-    def _replace_shape_image(self, shape, image_path):
+    def apply_images_to_pptx(
+        self, presentation, image_modifications, shapes_cache=None
+    ):
+        """Apply images to multiple shapes in batches（Slide shape list only enumerated once）
+
+        Image files are read in parallel by threads，shape XML Modifications are still serial
+        （python-pptx Objects are not thread-safe）.
+
+        Args:
+            presentation: Presentation object
+            image_modifications: {shape_id: image_path} Modify dictionary
+            shapes_cache: {slide_idx: [shape, ...]} cache，Can be shared with other apply_* calls
+
+        Returns:
+            int: Number of images successfully replaced
+        """
+        replaced = 0
+        slides = list(presentation.slides)
+        if shapes_cache is None:
+            shapes_cache = {}
+
+        # Locate all target picture shapes first
+        targets = []
+        for slide_idx, shape_idx, shape_id, image_path in self._order_changes(
+            image_modifications, log_invalid=True
+        ):
+            shape = self._lookup_shape(slides, shapes_cache, slide_idx, shape_idx)
+            if shape is None:
+                logger.debug(f"⚠️ Invalid shape index: {shape_id}")
+            elif not self._is_picture_shape(shape):
+                logger.debug(f"⚠️ Shape is not an image type: {shape_id}")
+            else:
+                targets.append((shape_id, shape, image_path))
+
+        if not targets:
+            return 0
+
+        # Read image bytes in parallel（I/O Release GIL）；The same file is read only once，
+        # Multiple shapes share the same bytes object
+        paths = list(dict.fromkeys(image_path for _, _, image_path in targets))
+        if len(paths) > 1:
+            workers = min(self.IMAGE_READ_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                blobs = dict(zip(paths, executor.map(self._read_image_file, paths)))
+        else:
+            blobs = {paths[0]: self._read_image_file(paths[0])}
+
+        for shape_id, shape, image_path in targets:
+            try:
+                if self._replace_shape_image(shape, image_path, blobs[image_path]):
+                    replaced += 1
+            except Exception as e:
+                logger.debug(f"❌ Applying image failed {shape_id}: {e}")
+
+        logger.debug(
+            f"📊 Image update completed: {replaced}/{len(image_modifications)} images"
+        )
+        return replaced
+
+    @staticmethod
+    def _read_image_file(image_path):
+        """Read image file bytes，Returned when the file cannot be read None"""
+        try:
+            with open(image_path, "rb") as f:
+                return f.read()
+        except OSError as e:
+            # Missing、Directory、No permission, etc.：Skip this image only
+            logger.debug(f"⚠️ Unable to read image file {image_path}: {e}")
+            return None
+
+    def _replace_shape_image(self, shape, image_path, image_data=None):
         """Replace image with shape - use the correctpython-pptx API"""
         try:
-            if not os.path.exists(image_path):
-                logger.debug(f"❌ Image file does not exist: {image_path}")
+            # Read new image data once，method1/method2 share the same bytes
+            # （Batch callers pass in pre-read bytes）
+            new_image_data = image_data
+            if new_image_data is None:
+                new_image_data = self._read_image_file(image_path)
+            if new_image_data is None:
+                logger.debug(f"❌ Image file unavailable: {image_path}")
                 return False
 
             logger.debug(
@@ -1187,10 +1563,6 @@ class PPTXFormEditor:
                     rId
                 )  # 🔧 use related_part，no related_parts
 
-                # Read new image data
-                with open(image_path, "rb") as f:
-                    new_image_data = f.read()
-
                 # Replace image data
                 image_part._blob = new_image_data
 
@@ -1211,10 +1583,6 @@ class PPTXFormEditor:
                     # Get relationship
                     rel = pic.part.rels[rId]
 
-                    # Read new pictures
-                    with open(image_path, "rb") as f:
-                        new_image_data = f.read()
-
                     # direct replacement
                     rel._target._blob = new_image_data
 
@@ -1235,13 +1603,24 @@ class PPTXFormEditor:
 
         except Exception as e:
             logger.debug(f"❌ Failed to replace image: {e}")
-            import traceback
-
             traceback.print_exc()
             return False
 
     def _extract_run_format(self, run):
         """Extract format information - SIMPLIFIED & SERIALIZABLE"""
+        # The format is entirely determined by rPr decide，same rPr reuse results
+        rPr = run._r.rPr
+        key = etree.tostring(rPr) if rPr is not None else b""
+        cached = self._fmt_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        format_info = self._compute_run_format(run)
+        self._fmt_cache[key] = format_info
+        return dict(format_info)
+
+    def _compute_run_format(self, run):
+        """Calculate run format information（Not cached）"""
         font = run.font
 
         # Base format info
@@ -1272,8 +1651,16 @@ class PPTXFormEditor:
         elif isinstance(obj, (str, int, float, bool)):
             return obj
         elif isinstance(obj, (list, tuple)):
+            # Fast path：Lists that are all primitive types are returned directly
+            if type(obj) is list and all(type(item) in _PRIMITIVE_TYPES for item in obj):
+                return obj
             return [self._make_serializable(item) for item in obj]
         elif isinstance(obj, dict):
+            # Fast path：The keys are all strings and the values are all basic types.（like run format）return directly
+            if all(type(key) is str for key in obj) and all(
+                type(value) in _PRIMITIVE_TYPES for value in obj.values()
+            ):
+                return obj
             return {
                 str(key): self._make_serializable(value) for key, value in obj.items()
             }
@@ -1311,24 +1698,15 @@ class PPTXFormEditor:
                     # You can customize this mapping based on your template
                     theme_color = getattr(color, "theme_color", None)
                     if theme_color:
-                        theme_name = str(theme_color)
+                        # Enumeration name（like ACCENT_1）；str() Shaped like "ACCENT_1 (5)" or
+                        # "MSO_THEME_COLOR.ACCENT_1"，Take the name part
+                        theme_name = getattr(theme_color, "name", None) or (
+                            str(theme_color).split(" ", 1)[0].rsplit(".", 1)[-1]
+                        )
                         # Map common theme colors to RGB
-                        theme_to_rgb = {
-                            "ACCENT_1": "#4F81BD",  # Blue
-                            "ACCENT_2": "#C0504D",  # Red
-                            "ACCENT_3": "#9BBB59",  # Green
-                            "ACCENT_4": "#8064A2",  # Purple
-                            "ACCENT_5": "#4BACC6",  # Light Blue
-                            "ACCENT_6": "#F79646",  # Orange
-                            "DARK_1": "#000000",  # Black
-                            "DARK_2": "#1F497D",  # Dark Blue
-                            "LIGHT_1": "#FFFFFF",  # White
-                            "LIGHT_2": "#EEECE1",  # Light Gray
-                        }
-
-                        for key, rgb_value in theme_to_rgb.items():
-                            if key in theme_name:
-                                return rgb_value
+                        rgb_value = _THEME_TO_RGB.get(theme_name)
+                        if rgb_value:
+                            return rgb_value
 
                     # Default for theme colors
                     return "#000000"  # Black
@@ -1336,9 +1714,7 @@ class PPTXFormEditor:
             # Method 3: Try string parsing
             color_str = str(color)
             if "RGB(" in color_str:
-                import re
-
-                match = re.search(r"RGB\((\d+),\s*(\d+),\s*(\d+)\)", color_str)
+                match = _RGB_RE.search(color_str)
                 if match:
                     r, g, b = (
                         int(match.group(1)),
@@ -1354,53 +1730,37 @@ class PPTXFormEditor:
             logger.debug(f"Color extraction error: {e}")
             return "#000000"  # Black fallback
 
-    def apply_structured_changes_to_pptx(self, presentation, structured_changes):
+    def apply_structured_changes_to_pptx(
+        self, presentation, structured_changes, shapes_cache=None
+    ):
         """Apply structural changes toPPTX（one by oneRunrenew，protect borders）"""
         updated_shapes = 0
         updated_runs = 0
 
-        for shape_id, structured_data in structured_changes.items():
+        # Slides and shape lists are only enumerated once（Caller can share cache）
+        slides = list(presentation.slides)
+        if shapes_cache is None:
+            shapes_cache = {}
+
+        for slide_idx, shape_idx, shape_id, structured_data in self._order_changes(
+            structured_changes
+        ):
             try:
-                # Skip if this is a table (tables are handled separately)
-                if shape_id.startswith("slide_") and "_shape_" in shape_id:
-                    parts = shape_id.split("_")
-                    if len(parts) >= 4:
-                        slide_idx = int(parts[1])
-                        shape_idx = int(parts[3])
-
-                        if 0 <= slide_idx < len(presentation.slides):
-                            slide = presentation.slides[slide_idx]
-                            if 0 <= shape_idx < len(slide.shapes):
-                                shape = slide.shapes[shape_idx]
-                                if hasattr(shape, "has_table") and shape.has_table:
-                                    logger.debug(
-                                        f"⏭️ Skipping table shape in text update: {shape_id}"
-                                    )
-                                    continue
-
-                # Analyze shapesID
-                parts = shape_id.split("_")
-                if not (
-                    len(parts) >= 4 and parts[0] == "slide" and parts[2] == "shape"
-                ):
+                # Get the corresponding shape
+                shape = self._lookup_shape(slides, shapes_cache, slide_idx, shape_idx)
+                if shape is None:
                     continue
 
-                slide_idx = int(parts[1])
-                shape_idx = int(parts[3])
-
-                # Get the corresponding shape
-                if 0 <= slide_idx < len(presentation.slides):
-                    slide = presentation.slides[slide_idx]
-                    if 0 <= shape_idx < len(slide.shapes):
-                        shape = slide.shapes[shape_idx]
+                # Skip if this is a table (tables are handled separately)
+                if getattr(shape, "has_table", False):
+                    logger.debug(f"⏭️ Skipping table shape in text update: {shape_id}")
+                    continue
 
-                        # Update text
-                        runs_updated = self._apply_text_with_boundary(
-                            shape, structured_data
-                        )
-                        if runs_updated > 0:
-                            updated_shapes += 1
-                            updated_runs += runs_updated
+                # Update text
+                runs_updated = self._apply_text_with_boundary(shape, structured_data)
+                if runs_updated > 0:
+                    updated_shapes += 1
+                    updated_runs += runs_updated
 
             except Exception as e:
                 logger.debug(f"❌ deal with {shape_id} fail: {e}")
@@ -1410,6 +1770,53 @@ class PPTXFormEditor:
         )
         return updated_shapes
 
+    @staticmethod
+    def _order_changes(changes, log_invalid=False):
+        """Parse changes shapeID，by (slide_idx, shape_idx) Sort，Make changes to the same slide continuous
+
+        Args:
+            changes: {shape_id: data} Modify dictionary
+            log_invalid: Whether to log invalid shapesID
+
+        Returns:
+            [(slide_idx, shape_idx, shape_id, data), ...]
+        """
+        ordered = []
+        for shape_id, data in changes.items():
+            parsed = _parse_shape_id(shape_id)
+            if not parsed:
+                if log_invalid:
+                    logger.debug(f"⚠️ Invalid shape ID format: {shape_id}")
+                continue
+            ordered.append((parsed[0], parsed[1], shape_id, data))
+
+        ordered.sort(key=lambda item: (item[0], item[1]))
+        return ordered
+
+    @staticmethod
+    def _lookup_shape(slides, shapes_cache, slide_idx, shape_idx):
+        """Find shapes by index，Each slide's shape list is enumerated only once
+
+        Args:
+            slides: list(presentation.slides)
+            shapes_cache: {slide_idx: [shape, ...]} cache
+            slide_idx: Slide index
+            shape_idx: shape index
+
+        Returns:
+            Shape object，Returns when index is out of range None
+        """
+        if not 0 <= slide_idx < len(slides):
+            return None
+
+        shapes = shapes_cache.get(slide_idx)
+        if shapes is None:
+            shapes = shapes_cache[slide_idx] = list(slides[slide_idx].shapes)
+
+        if not 0 <= shape_idx < len(shapes):
+            return None
+        return shapes[shape_idx]
+
     def _apply_text_with_boundary(self, shape, structured_data):
         """one by oneRunUpdate text，protect borders"""
         if not hasattr(shape, "text_frame") or not shape.text_frame:
@@ -1418,20 +1825,23 @@ class PPTXFormEditor:
         text_frame = shape.text_frame
         updated_runs = 0
 
+        # Paragraphs andRunThe list only traverses once XML
+        paragraphs = list(text_frame.paragraphs)
+
         # Process by paragraph
         for para_idx, para_data in enumerate(structured_data):
-            if para_idx >= len(text_frame.paragraphs):
+            if para_idx >= len(paragraphs):
                 break
 
-            paragraph = text_frame.paragraphs[para_idx]
+            runs = list(paragraphs[para_idx].runs)
             runs_data = para_data.get("runs", [])
 
             # one by oneRunrenew
             for run_idx, run_data in enumerate(runs_data):
-                if run_idx >= len(paragraph.runs):
+                if run_idx >= len(runs):
                     break
 
-                run = paragraph.runs[run_idx]
+                run = runs[run_idx]
 
                 # 🎯 restore boundaries
                 core_text = run_data.get("text", "")
@@ -1447,44 +1857,39 @@ class PPTXFormEditor:
         logger.debug(f"✅ Update completed: {updated_runs} runs")
         return updated_runs > 0
 
-    def apply_table_changes_to_pptx(self, presentation, table_changes):
+    def apply_table_changes_to_pptx(
+        self, presentation, table_changes, shapes_cache=None
+    ):
         """Apply table changes toPPTX（only update text，protect format）"""
         updated_tables = 0
         updated_cells = 0
 
-        for shape_id, table_data in table_changes.items():
-            try:
-                # Parse shape ID
-                parts = shape_id.split("_")
-                if not (
-                    len(parts) >= 4 and parts[0] == "slide" and parts[2] == "shape"
-                ):
-                    logger.debug(f"⚠️ Invalid shape ID format: {shape_id}")
-                    continue
-
-                slide_idx = int(parts[1])
-                shape_idx = int(parts[3])
+        # Slides and shape lists are only enumerated once（Caller can share cache）
+        slides = list(presentation.slides)
+        if shapes_cache is None:
+            shapes_cache = {}
 
+        for slide_idx, shape_idx, shape_id, table_data in self._order_changes(
+            table_changes, log_invalid=True
+        ):
+            try:
                 # Get the corresponding shape
-                if 0 <= slide_idx < len(presentation.slides):
-                    slide = presentation.slides[slide_idx]
-                    if 0 <= shape_idx < len(slide.shapes):
-                        shape = slide.shapes[shape_idx]
+                shape = self._lookup_shape(slides, shapes_cache, slide_idx, shape_idx)
+                if shape is None:
+                    continue
 
-                        # Check if it's a table
-                        if shape.has_table:
-                            # Update table cells
-                            cells_updated = self._apply_table_cell_changes(
-                                shape, table_data
-                            )
-                            if cells_updated > 0:
-                                updated_tables += 1
-                                updated_cells += cells_updated
-                                logger.debug(
-                                    f"✅ Updated table {shape_id}: {cells_updated} cells"
-                                )
-                        else:
-                            logger.debug(f"⚠️ Shape {shape_id} is not a table")
+                # Check if it's a table
+                if shape.has_table:
+                    # Update table cells
+                    cells_updated = self._apply_table_cell_changes(shape, table_data)
+                    if cells_updated > 0:
+                        updated_tables += 1
+                        updated_cells += cells_updated
+                        logger.debug(
+                            f"✅ Updated table {shape_id}: {cells_updated} cells"
+                        )
+                else:
+                    logger.debug(f"⚠️ Shape {shape_id} is not a table")
 
             except Exception as e:
                 logger.debug(f"❌ Failed to update table {shape_id}: {e}")
@@ -1588,3 +1993,9 @@ class PPTXFormEditor:
             logger.debug(f"⚠️ Error updating cell text with formatting: {e}")
             # Fallback to direct text update
             cell.text = new_text
+
+
+def _extract_slides_worker(pptx_path, slide_indices, assets_dir=None):
+    """Multi-process extraction worker：Open the file yourself and extract the specified slide"""
+    editor = PPTXFormEditor(pptx_path)
+    return editor._extract_slides(Presentation(pptx_path), slide_indices, assets_dir)
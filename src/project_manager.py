@@ -1,12 +1,25 @@
 # project_data_manager.py
 import tempfile
+import io
 import os
+import stat
+import sys
+import threading
+import copy
 import yaml
 import time
 import json
 import uuid
 import shutil
 import datetime
+import functools
+import contextlib
+import heapq
+import itertools
+import atexit
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from pptx import Presentation
 
@@ -17,16 +30,205 @@ from src.git_manager import GitManager
 from src.utils import logger
 from src.utils import cleanup_temp_files
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# priority use libyaml of C accomplish（Same semantics as pure Python version，Parsing is faster）
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+logger.debug(f"📄 YAMLLoader: {_YAML_LOADER.__name__}, Dumper: {_YAML_DUMPER.__name__}")
+
+# Image extensions listed in the project assets directory（Without dots，lower case）
+_IMG_EXTS = frozenset({"png", "jpg", "jpeg", "gif", "bmp"})
+
+
+def _is_image_name(name: str) -> bool:
+    """Determine whether the file name is a picture by extension（One slice + One set search）"""
+    dot = name.rfind(".")
+    return dot >= 0 and name[dot + 1 :].lower() in _IMG_EXTS
+
+
+try:
+    import platformdirs
+
+    _HAS_PLATFORMDIRS = True
+except ImportError:
+    _HAS_PLATFORMDIRS = False
+
+
+@functools.lru_cache(maxsize=1)
+def _compute_app_data_dir() -> str:
+    """Calculate the application data directory（The result is unchanged within the process，cache）"""
+    # Try using platformdirs
+    if _HAS_PLATFORMDIRS:
+        return platformdirs.user_data_dir("PPTeXpress", "Paradoxsolver")
+
+    # Fallback plan
+    if os.name == "nt":  # Windows
+        base_dir = os.getenv(
+            "LOCALAPPDATA",
+            os.path.join(os.path.expanduser("~"), "AppData", "Local"),
+        )
+        return os.path.join(base_dir, "PPTeXpress", "projects")
+    elif os.name == "posix":  # Linux/Mac
+        if sys.platform == "darwin":  # macOS
+            return os.path.join(
+                os.path.expanduser("~"),
+                "Library",
+                "Application Support",
+                "PPTeXpress",
+                "projects",
+            )
+        else:  # Linux
+            return os.path.join(
+                os.path.expanduser("~"),
+                ".local",
+                "share",
+                "pptexpress",
+                "projects",
+            )
+    else:
+        return os.path.join(os.path.expanduser("~"), "PPTeXpress", "projects")
+
+
+# Build output serial number（Unique within the process）
+_BUILD_COUNTER = itertools.count()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_work_dir() -> str:
+    """Build output directory（Created on first use，Deleted when the process exits）"""
+    work_dir = tempfile.mkdtemp(prefix="pptexpress_build_")
+    atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
+    return work_dir
+
+
+@functools.lru_cache(maxsize=256)
+def _split_yaml_key(key: str) -> tuple:
+    """Split dotted path keys（like "template.hash"），Result cache"""
+    return tuple(key.split("."))
+
+
+def _json_loads(data):
+    """JSONparse（priority use orjson，accept str/bytes）"""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """compactJSONserialization（priority use orjson，Non-ASCII Not escaped）"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Current time ISO String cache：(monotonic timestamp, string)，Replace the entire tuple when updating
+_now_iso_cache = (0.0, "")
+# Timestamp reuse window（Second）
+_NOW_ISO_TTL = 0.05
+
+
+def _now_iso() -> str:
+    """Current time ISO string（Reused in a short window，a batch save shares one）"""
+    global _now_iso_cache
+    stamp, text = _now_iso_cache
+    now = time.monotonic()
+    if not text or now - stamp >= _NOW_ISO_TTL:
+        text = datetime.datetime.now().isoformat()
+        _now_iso_cache = (now, text)
+    return text
+
+
+def _json_dumps_indented(obj) -> bytes:
+    """Two-space indentationJSONserialization，for writing back slide document（priority use orjson）"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _current_umask() -> int:
+    """Read process umask（os.umask Can only be read by setting，Restore immediately）"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Process umask（Read once on import，Avoid changing it concurrently from threads）
+_UMASK = _current_umask()
+
+
+def _replace_file_atomic(path: str, payload: bytes, fsync: bool = True):
+    """
+    Atomically replace file contents：Write temporary file in the same directory first，Again os.replace replace.
+    The file is either the old content or the new content，There will be no half-written state.
+
+    Args:
+        path: target file path
+        payload: Bytes to write
+        fsync: Whether to flush the temporary file to disk before replacing
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path),
+        prefix="." + os.path.basename(path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp creates 0600：keep the target's mode（new file：umask default）
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_path, mode)
+
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class ProjectManager:
     """Manage project data, sessions, and project lifecycle（Create, load, etc.）."""
 
+    # The maximum number of projects resident in memory（Recently used first，Evict the longest unused）
+    MAX_RESIDENT_PROJECTS = 64
+    # slide JSON Maximum number of entries in the parsing cache
+    MAX_CACHED_SLIDES = 1024
+    # Parallel read slide JSON The number of threads
+    SLIDE_READ_WORKERS = 8
+    # The maximum number of GitManager kept（Recently used first）
+    MAX_GIT_MANAGERS = 32
+    # Path existence probe cache validity period（Second）
+    PATH_PROBE_TTL = 1.0
+    # Maximum number of template files kept in memory（Reading when building PPTX）
+    MAX_CACHED_TEMPLATES = 4
+
     def __init__(self):
         self.projects = (
-            {}
+            OrderedDict()
         )  # project_id -> {project_dir, project_data, content, file_changes, memory_changes}
         self.sessions = {}  # session_id -> project_id
-        self.git_managers = {}
+        self.git_managers = OrderedDict()  # session_id -> GitManager（LRU）
+        self._yaml_cache = {}  # yaml_path -> (st_mtime_ns, st_size, data)
+        self._slide_cache = OrderedDict()  # json_path -> (st_mtime_ns, st_size, data)
+        self._slide_cache_lock = threading.Lock()
+        self._path_probe_cache = {}  # path -> (monotonic timestamp, readable)
+        self._slide_batch = threading.local()  # Batch write buffer for this thread
+        self._slide_count_cache = {}  # slides_dir -> (st_mtime_ns, count)
+        self._pptx_cache = {}  # session_id -> (Enter file signature, pptx_path)
+        self._template_blob_cache = OrderedDict()  # path -> (mtime_ns, size, bytes)
 
     # --- Data management methods ---
 
@@ -75,6 +277,8 @@ class ProjectManager:
 
         # 🔧 Create mapping：session_id（directory name） -> project_id
         self.sessions[session_id] = project_id
+        self.projects.move_to_end(project_id)
+        self._evict_stale_projects()
 
         logger.debug(f"✅ Storage completed:")
         logger.debug(f"  sessionID: {session_id}")
@@ -91,14 +295,27 @@ class ProjectManager:
         1. Regular items：The name of the project directory in the application data directory
         2. Snapshot viewer：Snapshot session in temporary cache directory
         """
-        logger.debug(f"🔍 get_project_by_session called: {session_id}")
+        logger.debug("🔍 get_project_by_session called: %s", session_id)
+
+        # ⚡ Session mapped and project attached（assets/Git）：Return directly to the project in memory
+        project_id = self.sessions.get(session_id)
+        if project_id is not None:
+            project = self.projects.get(project_id)
+            if project is not None and "assets_dir" in project:
+                self.projects.move_to_end(project_id)
+                return project
 
         # 🔧 Original regular item search logic（remain unchanged）
         app_data_dir = self.get_app_data_dir()
         project_dir = os.path.join(app_data_dir, session_id)
+        yaml_path = os.path.join(project_dir, "project.yaml")
 
-        if not os.path.exists(project_dir):
-            logger.debug(f"❌ Project directory does not exist: {project_dir}")
+        # once stat project.yaml：It also confirms that the project directory exists
+        if not os.path.exists(yaml_path):
+            if not os.path.isdir(project_dir):
+                logger.debug(f"❌ Project directory does not exist: {project_dir}")
+            else:
+                logger.debug(f"❌ project.yamldoes not exist: {yaml_path}")
             return None
 
         # 🔧 Revise：examineassetsDoes the directory exist?
@@ -109,14 +326,9 @@ class ProjectManager:
 
         # 🔧 Revise2：Check if it is already in memory，If not, load from file system
         # First find the project by directory nameID
-        yaml_path = os.path.join(project_dir, "project.yaml")
-        if not os.path.exists(yaml_path):
-            logger.debug(f"❌ project.yamldoes not exist: {yaml_path}")
-            return None
 
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                project_data = yaml.safe_load(f)
+            project_data = self._load_yaml_cached(yaml_path)
 
             if not project_data or "project" not in project_data:
                 logger.debug(f"❌ Invalid project data format: {session_id}")
@@ -134,64 +346,252 @@ class ProjectManager:
                     f"🔄 Item is not in memory，Load from file system: {project_id}"
                 )
 
-                # Parse template content（if needed）
-                content_structure = []
-                template_file = project_data.get("template", {}).get("file")
-                if template_file:
-                    template_path = os.path.join(project_dir, template_file)
-                    if os.path.exists(template_path):
-                        try:
-                            editor = PPTXFormEditor(template_path)
-                            pptx_content = editor.extract_editable_content()
-                            content_structure = pptx_content.get("slides", [])
-                            logger.debug(
-                                f"📊 Load template content，slidesquantity: {len(content_structure)}"
-                            )
-                        except Exception as e:
-                            logger.debug(
-                                f"⚠️ Parsing template failed，Use empty content: {e}"
-                            )
-                            content_structure = []
-
-                # store to memory
-                self.projects[project_id] = {
+                # Template content is parsed on first access（see get_project_content）
+                project_entry = {
                     "project_dir": project_dir,
-                    "project_data": project_data,
-                    "content": content_structure,
+                    "project_data": copy.deepcopy(project_data),
                     "file_changes": {},
                     "memory_changes": {},
                 }
+                template_file = project_data.get("template", {}).get("file")
+                if template_file:
+                    project_entry["_content_loader"] = functools.partial(
+                        self._load_template_content,
+                        os.path.join(project_dir, template_file),
+                    )
+                else:
+                    project_entry["content"] = []
+
+                # store to memory（Copy one，Avoid modifying the parsing cache）
+                self.projects[project_id] = project_entry
 
             # 🔧 Revise4：Create session mapping（session_id -> project_id）
             if session_id not in self.sessions:
                 self.sessions[session_id] = project_id
                 # logger.debug(f"🔄 Create session mapping: {session_id} -> {project_id}")
 
+            self.projects.move_to_end(project_id)
+            self._evict_stale_projects()
             project = self.projects[project_id]
             # logger.debug(f"✅ Obtain project data successfully")
             # logger.debug(f"   Project directory: {project.get('project_dir')}")
             # logger.debug(f"   projectID: {project_id}")
             # logger.debug(f"   slidesquantity: {len(project.get('content', []))}")
 
+            # GitManager Only in the LRU Hold in（Not stored in project data，Eviction can be released）
             if session_id not in self.git_managers:
                 # createGitManagerbut not initialized（The user may manually initialize）
-                git_manager = GitManager(project_dir)
-                self.git_managers[session_id] = git_manager
+                self._remember_git_manager(session_id, GitManager(project_dir))
                 logger.debug(f"🔧 GitManagerCreated（not initialized）")
 
             project["assets_dir"] = assets_dir
             project["images_dir"] = assets_dir
-            project["git_manager"] = self.git_managers[
-                session_id
-            ]  # 🔥 Optional：WillGitManagerAdd to project data
+            # Precompute common paths，Subsequent methods are read directly without repeated splicing
+            project_root = project["project_dir"]
+            project["yaml_path"] = os.path.join(project_root, "project.yaml")
+            project["slides_dir"] = os.path.join(project_root, "slides")
             return project
 
+        except Exception:
+            logger.exception("❌ Failed to obtain project information %s", session_id)
+            return None
+
+    def get_project_content(self, project: dict) -> list:
+        """
+        Get the content structure of the project（slides）.
+        Projects loaded from the file system parse the template only on first access.
+
+        Args:
+            project: get_project_by_session returned project data
+
+        Returns:
+            list: Content structure
+        """
+        loader = project.pop("_content_loader", None)
+        if loader is not None:
+            project["content"] = loader()
+        return project.get("content", [])
+
+    @staticmethod
+    def _load_template_content(template_path: str) -> list:
+        """Parse template content，Return empty content on failure"""
+        if not os.path.exists(template_path):
+            return []
+        try:
+            editor = PPTXFormEditor(template_path)
+            pptx_content = editor.extract_editable_content()
+            content_structure = pptx_content.get("slides", [])
+            logger.debug(
+                f"📊 Load template content，slidesquantity: {len(content_structure)}"
+            )
+            return content_structure
         except Exception as e:
-            logger.debug(f"❌ Failed to obtain project information {session_id}: {e}")
-            import traceback
+            logger.debug(f"⚠️ Parsing template failed，Use empty content: {e}")
+            return []
 
-            traceback.print_exc()
-            return None
+    def _evict_stale_projects(self):
+        """
+        The number of resident projects exceeds MAX_RESIDENT_PROJECTS hour，Evict the longest unused item.
+        Items with unsaved memory modifications and the most recently used item are not evicted.
+        """
+        excess = len(self.projects) - self.MAX_RESIDENT_PROJECTS
+        if excess <= 0:
+            return
+
+        for project_id in list(self.projects)[:-1]:
+            if excess <= 0:
+                break
+            if self.projects[project_id].get("memory_changes"):
+                continue
+            self._evict_project(project_id)
+            excess -= 1
+
+    def _evict_project(self, project_id: str):
+        """Remove the project from memory，release its sessions、builds and GitManager"""
+        self.projects.pop(project_id, None)
+        for session_id in [
+            sid for sid, pid in self.sessions.items() if pid == project_id
+        ]:
+            del self.sessions[session_id]
+            self._pptx_cache.pop(session_id, None)
+            git_manager = self.git_managers.pop(session_id, None)
+            if git_manager is not None:
+                git_manager.close_catfile_processes()
+        logger.debug(f"♻️ Evict long-unused project from memory: {project_id}")
+
+    def _cached_readable(self, path: str) -> bool:
+        """
+        Short-term cache os.access(path, R_OK) result（Includes non-existent），Repeated polling within the validity period is just a dictionary lookup.
+        Missing and unreadable directories fail fast，No scan will be entered.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            bool: Does the path exist and is readable?
+        """
+        now = time.monotonic()
+        cached = self._path_probe_cache.get(path)
+        if cached is not None and now - cached[0] < self.PATH_PROBE_TTL:
+            return cached[1]
+        readable = os.access(path, os.R_OK)
+        self._path_probe_cache[path] = (now, readable)
+        return readable
+
+    def _invalidate_path_probes(self, project_dir: str):
+        """
+        Clear the existence probe cache under the project directory（Called after directory write）.
+
+        Args:
+            project_dir: Project directory
+        """
+        prefix = os.path.join(project_dir, "")
+        for path in [
+            p
+            for p in self._path_probe_cache
+            if p == project_dir or p.startswith(prefix)
+        ]:
+            del self._path_probe_cache[path]
+
+    def _load_slide_json(self, json_file: str) -> dict:
+        """
+        read slide JSON，document（mtime/size）Reuse the last parsing result when unchanged.
+
+        Args:
+            json_file: slide JSON file path
+
+        Returns:
+            Parsed data（Shared cache object，Read only）
+        """
+        st = os.stat(json_file)
+        with self._slide_cache_lock:
+            cached = self._slide_cache.get(json_file)
+            if cached is not None and (st.st_mtime_ns, st.st_size) == cached[:2]:
+                self._slide_cache.move_to_end(json_file)
+                return cached[2]
+
+        with open(json_file, "rb") as f:
+            slide_data = _json_loads(f.read())
+
+        with self._slide_cache_lock:
+            self._slide_cache[json_file] = (st.st_mtime_ns, st.st_size, slide_data)
+            self._slide_cache.move_to_end(json_file)
+            if len(self._slide_cache) > self.MAX_CACHED_SLIDES:
+                self._slide_cache.popitem(last=False)
+        return slide_data
+
+    def _load_slide_jsons(self, json_files: list) -> list:
+        """
+        Read multiple in parallel slide JSON（Cache misses are dominated by file I/O）.
+
+        Args:
+            json_files: slide JSON file path list
+
+        Returns:
+            list: Parsed data in input order；Files that failed to read are replaced by the exception object
+        """
+
+        def load(json_file):
+            try:
+                return self._load_slide_json(json_file)
+            except Exception as e:
+                return e
+
+        if len(json_files) < 2:
+            return [load(json_file) for json_file in json_files]
+
+        workers = min(self.SLIDE_READ_WORKERS, len(json_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(load, json_files))
+
+    def _write_yaml_atomic(self, yaml_path: str, payload: bytes):
+        """
+        Write atomically project.yaml：Write temporary file in the same directory first，Again os.replace replace.
+        The file is either the old content or the new content，There will be no half-written state.
+
+        Args:
+            yaml_path: project.yaml path
+            payload: serialized YAML（UTF-8 bytes）
+        """
+        try:
+            _replace_file_atomic(yaml_path, payload)
+        finally:
+            self._yaml_cache.pop(yaml_path, None)
+
+    def _write_slide_file(self, slide_path: str, slide_data: dict):
+        """
+        Write back slide JSON：Serialize to bytes at once，Atomic replacement and invalidation parsing cache.
+        slide Write more frequently，No fsync，Rely on rename semantics to avoid half-written files.
+
+        Args:
+            slide_path: slide JSON file path
+            slide_data: slide data
+        """
+        try:
+            _replace_file_atomic(slide_path, _json_dumps_indented(slide_data), False)
+        finally:
+            self._slide_cache.pop(slide_path, None)
+
+    def _load_yaml_cached(self, yaml_path: str):
+        """
+        read project.yaml，document（mtime/size）Reuse the last parsing result when unchanged.
+
+        Args:
+            yaml_path: project.yaml path
+
+        Returns:
+            Parsed data（Shared cache object，Please copy before modifying）
+        """
+        st = os.stat(yaml_path)
+        cached = self._yaml_cache.get(yaml_path)
+        if cached is not None and (st.st_mtime_ns, st.st_size) == cached[:2]:
+            return cached[2]
+
+        # Read all bytes at once and then give it to the loader，Avoid reading in blocks by stream
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_YAML_LOADER)
+        self._yaml_cache[yaml_path] = (st.st_mtime_ns, st.st_size, data)
+        return data
 
     def update_memory_changes(self, session_id: str, changes: dict) -> bool:
         """
@@ -248,10 +648,11 @@ class ProjectManager:
         if not project:
             return False
 
-        yaml_path = os.path.join(project["project_dir"], "project.yaml")
+        yaml_path = project["yaml_path"]
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                project["project_data"] = yaml.safe_load(f) or {}
+            project["project_data"] = copy.deepcopy(
+                self._load_yaml_cached(yaml_path) or {}
+            )
             return True
         except Exception as e:
             logger.debug(f"❌ loadYAMLfail: {e}")
@@ -281,8 +682,16 @@ class ProjectManager:
             project_data["project"]["name"] = project_name
             # Save the updatedYAML
             yaml_path = os.path.join(project_dir, "project.yaml")
-            with open(yaml_path, "w", encoding="utf-8") as f:
-                yaml.dump(project_data, f, default_flow_style=False, allow_unicode=True)
+            # Serialize to UTF-8 bytes first，Write once more（Keep key insertion order，No sorting）
+            payload = yaml.dump(
+                project_data,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                encoding="utf-8",
+            )
+            self._write_yaml_atomic(yaml_path, payload)
 
         # Create session
         session_id = self.create_project_session(
@@ -335,8 +744,10 @@ class ProjectManager:
             shutil.copy2(pptx_path, template_path)
             logger.debug(f"📋 Copy template file: {template_name}")
 
-            # 3. Compute template hash
-            template_hash = calculate_template_hash(template_path)
+            # 3. Compute template hash（Background thread，and below PPTX Parse overlap）
+            hash_executor = ThreadPoolExecutor(max_workers=1)
+            hash_future = hash_executor.submit(calculate_template_hash, template_path)
+            hash_executor.shutdown(wait=False)
 
             # 4. Create projectIDand basic project data
             project_id = str(uuid.uuid4())[:8]
@@ -345,17 +756,18 @@ class ProjectManager:
                 or f"Project_{project_id}"
             )
 
+            now_iso = datetime.datetime.now().isoformat()
             initial_project_data = {
                 "project": {
                     "id": project_id,
                     "name": project_name,
-                    "created_at": datetime.datetime.now().isoformat(),
-                    "modified_at": datetime.datetime.now().isoformat(),
+                    "created_at": now_iso,
+                    "modified_at": now_iso,
                     "author": "user@example.com",
                 },
                 "template": {
                     "file": template_name,
-                    "hash": template_hash,
+                    "hash": None,  # Fill in after the hash thread completes
                     "original_name": os.path.basename(pptx_path),
                 },
                 "slides": [],  # Initially empty
@@ -366,6 +778,7 @@ class ProjectManager:
             editor = PPTXFormEditor(template_path)
             # 🔧 Revise：incomingproject_dirparameter
             project_data = editor.extract_for_project_init(project_dir=project_dir)
+            initial_project_data["template"]["hash"] = hash_future.result()
 
             if not project_data:
                 logger.debug("⚠️ No project data was extracted")
@@ -393,52 +806,49 @@ class ProjectManager:
                 }
 
             yaml_path = os.path.join(project_dir, "project.yaml")
-            with open(yaml_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    initial_project_data,
-                    f,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                )
+            # Serialize to UTF-8 bytes first，Write once more（Keep key insertion order，No sorting）
+            payload = yaml.dump(
+                initial_project_data,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                encoding="utf-8",
+            )
+            self._write_yaml_atomic(yaml_path, payload)
 
             logger.debug(f"💾 Save project configuration: {yaml_path}")
 
-            # 8. Reload for consistency
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                loaded_project_data = yaml.safe_load(f)
-
-            # 9. Get front-end editor format
+            # 8. Get front-end editor format
             editor_format = project_data.get("editor_format", {"slides": []})
 
-            # 10. Statistical picture information
+            # 9. Statistical picture information
             image_count = len(project_data.get("images_info", {}))
 
             logger.debug(f"✅ Project initialization completed:")
             logger.debug(f"   projectID: {project_id}")
             logger.debug(f"   Project name: {project_name}")
             logger.debug(
-                f"   slidesquantity: {len(loaded_project_data.get('slides', []))}"
+                f"   slidesquantity: {len(initial_project_data.get('slides', []))}"
             )
             logger.debug(f"   Number of pictures: {image_count}")
             logger.debug(
                 f"   front-end formatslides: {len(editor_format.get('slides', []))}"
             )
 
-            return project_id, loaded_project_data, editor_format
+            # The in-memory data is exactly what was written，No need to read it back from disk
+            return project_id, initial_project_data, editor_format
 
-        except Exception as e:
-            logger.debug(f"❌ Project initialization failed: {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Project initialization failed")
             raise
 
     def _create_project_structure(self, project_dir: str):
         """Create project directory structure"""
-        os.makedirs(project_dir, exist_ok=True)
+        # makedirs Parent directories will be created along the way（project_dir、assets）
         os.makedirs(os.path.join(project_dir, "slides"), exist_ok=True)
-        os.makedirs(os.path.join(project_dir, "assets"), exist_ok=True)
-        os.makedirs(os.path.join(project_dir, "assets", "images"), exist_ok=True)  # New
+        os.makedirs(os.path.join(project_dir, "assets", "images"), exist_ok=True)
+        self._invalidate_path_probes(project_dir)
         logger.debug(f"📁 Create project directory structure: {project_dir}")
 
     def open_project(self, project_dir: str) -> dict:
@@ -457,19 +867,19 @@ class ProjectManager:
 
         logger.debug(f"🔄 Open project directory: {project_dir}")
 
-        # Basic verification：Does the project directory exist?
-        if not os.path.exists(project_dir):
-            error_msg = f"Project directory does not exist: {project_dir}"
-            logger.debug(f"❌ {error_msg}")
-            return {
-                "status": "error",
-                "message": error_msg,
-                "error_type": "directory_not_found",
-            }
-
-        # Verify required documents
+        # Verify required documents（once stat project.yaml，The project directory is only checked if it is missing）
         yaml_path = os.path.join(project_dir, "project.yaml")
         if not os.path.exists(yaml_path):
+            # Basic verification：Does the project directory exist?
+            if not os.path.isdir(project_dir):
+                error_msg = f"Project directory does not exist: {project_dir}"
+                logger.debug(f"❌ {error_msg}")
+                return {
+                    "status": "error",
+                    "message": error_msg,
+                    "error_type": "directory_not_found",
+                }
+
             error_msg = f"Project directory is missing project.yaml document"
             logger.debug(f"❌ {error_msg}")
             return {
@@ -478,10 +888,9 @@ class ProjectManager:
                 "error_type": "missing_yaml",
             }
 
-        # load project.yaml
+        # load project.yaml（Parse results are shared with subsequent session loads）
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                project_data = yaml.safe_load(f)
+            project_data = copy.deepcopy(self._load_yaml_cached(yaml_path))
 
             if not project_data or "project" not in project_data:
                 error_msg = "project.yaml Invalid file format"
@@ -532,7 +941,7 @@ class ProjectManager:
             }
 
         # Get content structure
-        content_structure = project_obj.get("content", [])
+        content_structure = self.get_project_content(project_obj)
 
         # Build return data
         project_info = {
@@ -570,12 +979,11 @@ class ProjectManager:
         """
         project_dir = os.path.abspath(project_dir)
 
-        if not os.path.exists(project_dir):
-            return False, f"Project directory does not exist: {project_dir}"
-
-        # Check required documents
+        # Check required documents（The project directory is only checked if it is missing）
         yaml_path = os.path.join(project_dir, "project.yaml")
         if not os.path.exists(yaml_path):
+            if not os.path.isdir(project_dir):
+                return False, f"Project directory does not exist: {project_dir}"
             return False, f"Lack project.yaml document"
 
         # Check required directories
@@ -583,10 +991,9 @@ class ProjectManager:
         if not os.path.exists(slides_dir):
             return False, f"Lack slides Table of contents"
 
-        # try to loadYAMLVerify format
+        # try to loadYAMLVerify format（Read-only，Reuse parsing cache）
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                project_data = yaml.safe_load(f)
+            project_data = self._load_yaml_cached(yaml_path)
 
             if not project_data or "project" not in project_data:
                 return False, "project.yaml Invalid format"
@@ -639,7 +1046,7 @@ class ProjectManager:
         project_data = project["project_data"]
 
         # Calculate critical path based on project directory
-        slides_dir = os.path.join(project_dir, "slides")
+        slides_dir = project["slides_dir"]
         assets_dir = os.path.join(project_dir, "assets")
         images_dir = os.path.join(project_dir, "assets", "images")
 
@@ -673,6 +1080,8 @@ class ProjectManager:
         images_info = self.list_project_images(session_id)
         result["images"] = images_info
 
+        fromtimestamp = datetime.datetime.fromtimestamp
+
         # Check directory
         for dir_path in dirs_to_check:
             dir_name = os.path.basename(dir_path)
@@ -684,54 +1093,69 @@ class ProjectManager:
 
             if os.path.exists(dir_path):
                 try:
-                    for filename in os.listdir(dir_path):
-                        filepath = os.path.join(dir_path, filename)
-                        if os.path.isfile(filepath):
-                            file_info = {
-                                "name": filename,
-                                "size": os.path.getsize(filepath),
-                                "modified": datetime.datetime.fromtimestamp(
-                                    os.path.getmtime(filepath)
-                                ).isoformat(),
-                            }
-                            result["directories"][dir_name]["files"].append(file_info)
+                    # scandir of DirEntry cache stat，Only one system call per file
+                    with os.scandir(dir_path) as entries:
+                        for entry in entries:
+                            if entry.is_file():
+                                st = entry.stat()
+                                file_info = {
+                                    "name": entry.name,
+                                    "size": st.st_size,
+                                    "modified": fromtimestamp(st.st_mtime).isoformat(),
+                                }
+                                result["directories"][dir_name]["files"].append(
+                                    file_info
+                                )
                 except PermissionError:
                     result["directories"][dir_name]["permission_error"] = True
 
         # Check specific important files
         important_files = {
-            "project.yaml": os.path.join(project_dir, "project.yaml"),
+            "project.yaml": project["yaml_path"],
             "latest_slide": None,
         }
 
         # find the latestslidedocument
         if os.path.exists(slides_dir):
             try:
-                slide_files = [f for f in os.listdir(slides_dir) if f.endswith(".json")]
-                if slide_files:
-                    latest = max(
-                        slide_files,
-                        key=lambda f: os.path.getmtime(os.path.join(slides_dir, f)),
-                    )
-                    important_files["latest_slide"] = os.path.join(slides_dir, latest)
+                with os.scandir(slides_dir) as entries:
+                    slide_entries = [
+                        e for e in entries if e.name.endswith(".json") and e.is_file()
+                    ]
+                if slide_entries:
+                    latest = max(slide_entries, key=lambda e: e.stat().st_mtime)
+                    important_files["latest_slide"] = latest.path
             except PermissionError:
                 result["files"]["slides_permission_error"] = True
 
         for name, path in important_files.items():
             if path and os.path.exists(path):
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        content = f.read()[:500]  # Read only before500character
+                    # Read only before500character（Up to 4 bytes each in UTF-8，Bounded read）
+                    with open(path, "rb") as f:
+                        st = os.fstat(f.fileno())
+                        raw = f.read(2000)
+                    content = raw.decode("utf-8", errors="replace")[:500]
 
                     result["files"][name] = {
                         "exists": True,
                         "path": path,
                         "preview": content,
-                        "size": os.path.getsize(path),
-                        "modified": datetime.datetime.fromtimestamp(
-                            os.path.getmtime(path)
-                        ).isoformat(),
+                        "size": st.st_size,
+                        "modified": fromtimestamp(st.st_mtime).isoformat(),
                     }
+
+                    if name == "latest_slide":
+                        # Summary from slide Parse cache（Not read the whole file again）
+                        try:
+                            slide_data = self._load_slide_json(path)
+                            result["files"][name]["summary"] = {
+                                "id": slide_data.get("id"),
+                                "slide_number": slide_data.get("slide_number"),
+                                "shape_count": len(slide_data.get("shapes", {})),
+                            }
+                        except (ValueError, OSError) as e:
+                            result["files"][name]["summary_error"] = str(e)
                 except Exception as e:
                     result["files"][name] = {
                         "exists": True,
@@ -777,15 +1201,22 @@ class ProjectManager:
         project_dir = project["project_dir"]
         project_data = project["project_data"]
 
+        # Scan the project directory once，All existence checks below are answered from it
+        try:
+            with os.scandir(project_dir) as it:
+                entries = {e.name: e for e in it}
+        except FileNotFoundError:
+            entries = {}
+
         # Check required directories
         required_dirs = ["slides"]
         for dir_name in required_dirs:
-            if not os.path.exists(os.path.join(project_dir, dir_name)):
+            entry = entries.get(dir_name)
+            if entry is None or not entry.is_dir():
                 return False, f"Missing required directory: {dir_name}"
 
         # verifyproject.yamlFormat
-        yaml_path = os.path.join(project_dir, "project.yaml")
-        if not os.path.exists(yaml_path):
+        if "project.yaml" not in entries:
             return False, "Lackproject.yamldocument"
 
         # Validation template file
@@ -794,17 +1225,22 @@ class ProjectManager:
             return False, "Template file information is missing in project data"
 
         template_path = os.path.join(project_dir, template_file)
-        if not os.path.exists(template_path):
+        template_exists = (
+            template_file in entries
+            if os.path.basename(template_file) == template_file
+            else os.path.exists(template_path)
+        )
+        if not template_exists:
             # Try fuzzy matching
             template_files = [
-                f
-                for f in os.listdir(project_dir)
-                if f.startswith("template_") and f.endswith(".pptx")
+                e.path
+                for name, e in entries.items()
+                if name.startswith("template_") and name.endswith(".pptx")
             ]
             if not template_files:
                 return False, "Template file missing"
             # Use the first template file found
-            template_path = os.path.join(project_dir, template_files[0])
+            template_path = template_files[0]
 
         # Verify template hash（critical safety features）
         expected_hash = project_data.get("template", {}).get("hash")
@@ -835,36 +1271,41 @@ class ProjectManager:
             logger.debug(f"❌ Update failed：Invalid sessionID: {session_id}")
             return False
 
-        project_dir = project["project_dir"]
-        yaml_path = os.path.join(project_dir, "project.yaml")
+        yaml_path = project["yaml_path"]
 
         try:
-            # Read current file data（as a baseline）
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                file_data = yaml.safe_load(f) or {}
+            # Read current file data（as a baseline；Copy the cached parse，Will be modified below）
+            baseline = self._load_yaml_cached(yaml_path) or {}
+            file_data = copy.deepcopy(baseline)
 
             # Get project data in memory
             memory_data = project["project_data"]
 
-            # Ensure the data structure is complete
-            if "project" not in memory_data:
-                memory_data["project"] = {}
-            if "project" not in file_data:
-                file_data["project"] = {}
-
-            # Update modification time（Update memory and file data simultaneously）
-            current_time = datetime.datetime.now().isoformat()
-            memory_data["project"]["modified_at"] = current_time
-            file_data["project"]["modified_at"] = current_time
-
-            # Apply additional updates（if providedupdate_data）
+            # Update data provided but no actual changes：Skip writing and modification time（no-op）
             if update_data:
-                self._apply_yaml_updates(memory_data, update_data)
-                self._apply_yaml_updates(file_data, update_data)
+                self._apply_yaml_updates_multi((file_data,), update_data)
+                if file_data == baseline:
+                    self._apply_yaml_updates_multi((memory_data,), update_data)
+                    logger.debug(f"⏭️ project.yamlNo change，Skip writing: {yaml_path}")
+                    return True
+
+            # Update modification time first，Reapply additional updates（if providedupdate_data）
+            # Memory and file data are updated in the same batch（missing project Will be created automatically）
+            updates = {"project.modified_at": _now_iso()}
+            if update_data:
+                updates.update(update_data)
+            self._apply_yaml_updates_multi((memory_data, file_data), updates)
 
             # save to file
-            with open(yaml_path, "w", encoding="utf-8") as f:
-                yaml.dump(file_data, f, default_flow_style=False, allow_unicode=True)
+            payload = yaml.dump(
+                file_data,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                encoding="utf-8",
+            )
+            self._write_yaml_atomic(yaml_path, payload)
 
             # Synchronously update project data in memory
             project["project_data"] = memory_data
@@ -879,18 +1320,18 @@ class ProjectManager:
             logger.debug(f"❌ renewproject.yamlfail: {e}")
             return False
 
-    def _apply_yaml_updates(self, data: dict, update_data: dict):
+    def _apply_yaml_updates_multi(self, targets, update_data: dict):
         """
-        internal method：Apply updated data toYAMLin data structure，Supports dotted paths.
+        internal method：Apply the same update data to multipleYAMLdata structure，Each key is only split once.
 
         Args:
-            data (dict): target data
-            update_data (dict): Update data
+            targets: target data（dict sequence）
+            update_data (dict): Update data，Supports dotted paths such as "template.hash"
         """
         for key, value in update_data.items():
-            if "." in key:
-                # Support dotted paths，like "template.hash"
-                parts = key.split(".")
+            # Support dotted paths，like "template.hash"
+            parts = _split_yaml_key(key)
+            for data in targets:
                 current = data
                 for part in parts[:-1]:
                     if part not in current:
@@ -903,9 +1344,6 @@ class ProjectManager:
                         current[part] = {}
                     current = current[part]
                 current[parts[-1]] = value
-            else:
-                # Top level key update
-                data[key] = value
 
     def get_project_yaml_path(self, session_id: str) -> str:
         """
@@ -921,8 +1359,7 @@ class ProjectManager:
         if not project:
             return ""
 
-        project_dir = project["project_dir"]
-        return os.path.join(project_dir, "project.yaml")
+        return project["yaml_path"]
 
     def fetch_changes(self, session_id: str, merge_with_existing: bool = True) -> dict:
         """
@@ -937,136 +1374,52 @@ class ProjectManager:
                 For text: {shape_id: {"txt": text_content}}
                 For table: {shape_id: {"type": "table", "changes": {}, "original_data": table_data}}
         """
-        project = self.get_project_by_session(session_id)
-        if not project:
-            logger.debug(f"❌ fetch_changesfail：Invalid sessionID: {session_id}")
-            return {}
+        changes, _ = self._fetch_changes_views(session_id, merge_with_existing)
+        return changes
 
-        project_dir = project["project_dir"]
-        slides_dir = os.path.join(project_dir, "slides")
-
-        changes = {}
+    def fetch_changes_by_slide(self, session_id: str) -> dict:
+        """
+        according toslideExtract modifications in groups.
 
-        if not os.path.exists(slides_dir):
-            logger.debug(f"⚠️  slidesDirectory does not exist: {slides_dir}")
-            return changes
+        Args:
+            session_id (str): sessionID
 
-        try:
-            json_files = [f for f in os.listdir(slides_dir) if f.endswith(".json")]
-            logger.debug(f"🔍 Discover {len(json_files)} indivualslide JSONdocument")
+        Returns:
+            dict: The format is {slide_id: {shape_id: content_data, ...}, ...}
+        """
+        _, slide_changes = self._fetch_changes_views(
+            session_id, merge_with_existing=False
+        )
+        return slide_changes
 
-            for filename in json_files:
-                json_file = os.path.join(slides_dir, filename)
-                try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        slide_data = json.load(f)
+    def _fetch_changes_views(
+        self, session_id: str, merge_with_existing: bool
+    ) -> tuple[dict, dict]:
+        """
+        Scan all at once slide JSON，Return both flat and by-slide views of modifications.
 
-                    # extractslide IDfor contextual information
-                    slide_id = slide_data.get("id", filename.replace(".json", ""))
+        Args:
+            session_id (str): sessionID
+            merge_with_existing (bool): Whether the flat view merges modifications in memory
 
-                    # Extract all modifications (text and tables)
-                    if "shapes" in slide_data:
-                        for shape_id, shape_data in slide_data["shapes"].items():
-                            # 🎯 Case 1: Text data
-                            if "txt" in shape_data:
-                                text_content = shape_data["txt"]
-                                changes[shape_id] = {"txt": text_content}
+        Returns:
+            tuple[dict, dict]: ({shape_id: content_data}, {slide_id: {shape_id: content_data}})
+        """
+        project = self.get_project_by_session(session_id)
+        if not project:
+            logger.debug(f"❌ fetch_changesfail：Invalid sessionID: {session_id}")
+            return {}, {}
 
-                                # debugging information
-                                if (
-                                    len(json_files) <= 5
-                                ):  # Print in detail when the file is small
-                                    shape_type = shape_data.get("t", "unknown")
-                                    logger.debug(
-                                        f"  extract: slide={slide_id}, shape={shape_id}, type={shape_type}, textlength={len(text_content)}"
-                                    )
-
-                            # 🎯 Case 2: Table data (NEW)
-                            if "table_data" in shape_data and shape_data["table_data"]:
-                                try:
-                                    # Parse table data
-                                    table_json = shape_data["table_data"]
-                                    table_data = (
-                                        json.loads(table_json)
-                                        if isinstance(table_json, str)
-                                        else table_json
-                                    )
-
-                                    # Extract cell changes
-                                    cell_changes = {}
-                                    if isinstance(table_data, list):
-                                        for row_idx, row in enumerate(table_data):
-                                            if isinstance(row, list):
-                                                for col_idx, cell in enumerate(row):
-                                                    if (
-                                                        isinstance(cell, dict)
-                                                        and "text" in cell
-                                                    ):
-                                                        # Create cell key
-                                                        cell_key = (
-                                                            f"row{row_idx}_col{col_idx}"
-                                                        )
-                                                        cell_changes[cell_key] = {
-                                                            "row": row_idx,
-                                                            "col": col_idx,
-                                                            "text": cell.get(
-                                                                "text", ""
-                                                            ),
-                                                            "original_text": cell.get(
-                                                                "original_text", ""
-                                                            ),
-                                                        }
-
-                                    # Build table structure
-                                    table_structure = {
-                                        "type": "table",
-                                        "changes": cell_changes,
-                                        "original_data": (
-                                            table_json
-                                            if isinstance(table_json, str)
-                                            else json.dumps(
-                                                table_json, ensure_ascii=False
-                                            )
-                                        ),
-                                        "mod": shape_data.get("mod", ""),
-                                        "rows": (
-                                            len(table_data)
-                                            if isinstance(table_data, list)
-                                            else 0
-                                        ),
-                                        "cols": (
-                                            len(table_data[0])
-                                            if (
-                                                isinstance(table_data, list)
-                                                and len(table_data) > 0
-                                                and isinstance(table_data[0], list)
-                                            )
-                                            else 0
-                                        ),
-                                    }
-
-                                    # Handle shape with both text and table data
-                                    if shape_id in changes:
-                                        # Already has text data, add table data
-                                        changes[shape_id]["table"] = table_structure
-                                    else:
-                                        # Only table data
-                                        changes[shape_id] = table_structure
-
-                                    if len(json_files) <= 5:
-                                        logger.debug(
-                                            f"  extract: slide={slide_id}, shape={shape_id}, table={table_structure['rows']}x{table_structure['cols']}, cells={len(cell_changes)}"
-                                        )
+        slides_dir = project["slides_dir"]
 
-                                except (json.JSONDecodeError, TypeError) as e:
-                                    logger.debug(
-                                        f"❌ Failed to parse table data for {shape_id}: {e}"
-                                    )
+        if not self._cached_readable(slides_dir):
+            logger.debug(
+                f"⚠️  slidesDirectory does not exist or is unreadable: {slides_dir}"
+            )
+            return {}, {}
 
-                except json.JSONDecodeError as e:
-                    logger.debug(f"❌ JSONParse error {filename}: {e}")
-                except Exception as e:
-                    logger.debug(f"❌ Reading file error {filename}: {e}")
+        try:
+            changes, slide_changes = self._scan_slide_changes(slides_dir)
 
             # Merge with changes in memory (if needed)
             if merge_with_existing and project.get("memory_changes"):
@@ -1078,7 +1431,7 @@ class ProjectManager:
                 # File modifications take precedence over memory modifications
                 for shape_id, content in existing_changes.items():
                     if shape_id not in changes:
-                        changes[shape_id] = content
+                        changes[shape_id] = self._normalize_change(content)
 
             # Merge with changes in file (if needed)
             if merge_with_existing and project.get("file_changes"):
@@ -1088,20 +1441,7 @@ class ProjectManager:
                 # File modifications take precedence over memory modifications，butslideFile modification takes priority
                 for shape_id, content in file_changes.items():
                     if shape_id not in changes:
-                        changes[shape_id] = content
-
-            # 🎯 Ensure consistent format
-            for shape_id, content in changes.items():
-                if isinstance(content, list) or isinstance(content, str):
-                    # Legacy text format, convert to new format
-                    changes[shape_id] = {"txt": content}
-                elif (
-                    isinstance(content, dict)
-                    and "txt" not in content
-                    and "type" not in content
-                ):
-                    # Unknown dict format, assume text
-                    changes[shape_id] = {"txt": content}
+                        changes[shape_id] = self._normalize_change(content)
 
             logger.debug(
                 f"✅ fetch_changesFinish: Total extraction {len(changes)} modifications"
@@ -1122,138 +1462,235 @@ class ProjectManager:
                 f"📊 Statistics: {text_count} text shapes, {table_count} table shapes"
             )
 
-            return changes
+            return changes, slide_changes
 
         except Exception as e:
             logger.debug(f"❌ fetch_changesfail: {e}")
-            return {}
+            return {}, {}
 
-    def fetch_changes_by_slide(self, session_id: str) -> dict:
+    @staticmethod
+    def _normalize_change(content):
         """
-        according toslideExtract modifications in groups.
+        Unify modified content into the current format（slide The scan result is already in this format，
+        Only memory/Normalized when merging file modifications）.
 
         Args:
-            session_id (str): sessionID
+            content: Modify content（Legacy list/str，or dict）
 
         Returns:
-            dict: The format is {slide_id: {shape_id: content_data, ...}, ...}
+            {"txt": ...} or table modification dict
         """
-        project = self.get_project_by_session(session_id)
-        if not project:
-            return {}
+        if isinstance(content, (list, str)):
+            # Legacy text format, convert to new format
+            return {"txt": content}
+        if isinstance(content, dict) and "txt" not in content and "type" not in content:
+            # Unknown dict format, assume text
+            return {"txt": content}
+        return content
 
-        project_dir = project["project_dir"]
-        slides_dir = os.path.join(project_dir, "slides")
+    def _scan_slide_changes(self, slides_dir: str) -> tuple[dict, dict]:
+        """
+        traverse slide JSON document，Collect text and table modifications at the same time.
+        The two views share the same shape Content object（shape_id Contains slide index，Not repeated across slides）.
+
+        Args:
+            slides_dir (str): slidesTable of contents
 
+        Returns:
+            tuple[dict, dict]: (Flat view, According to slide group view)
+            Table structures are shared with the slide parse cache，Callers must treat them as read-only.
+        """
+        changes = {}
         slide_changes = {}
 
-        if not os.path.exists(slides_dir):
-            return slide_changes
+        with os.scandir(slides_dir) as entries:
+            json_files = [
+                (e.name, e.path)
+                for e in entries
+                if e.name.endswith(".json") and e.is_file()
+            ]
+        logger.debug(f"🔍 Discover {len(json_files)} indivualslide JSONdocument")
+        verbose = len(json_files) <= 5  # Print in detail when the file is small
 
-        try:
-            for filename in os.listdir(slides_dir):
-                if not filename.endswith(".json"):
+        loaded = self._load_slide_jsons([json_file for _, json_file in json_files])
+
+        for (filename, _), slide_data in zip(json_files, loaded):
+            try:
+                if isinstance(slide_data, Exception):
+                    raise slide_data
+
+                # extractslide IDfor contextual information
+                # File names all end with .json（Filtered when scanning），Only construct on demand
+                slide_id = slide_data["id"] if "id" in slide_data else filename[:-5]
+                shape_changes = slide_changes[slide_id] = {}
+
+                # Extract all modifications (text and tables)
+                if "shapes" not in slide_data:
                     continue
 
-                json_file = os.path.join(slides_dir, filename)
-                try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        slide_data = json.load(f)
-
-                    slide_id = slide_data.get("id", filename.replace(".json", ""))
-                    slide_changes[slide_id] = {}
-
-                    if "shapes" in slide_data:
-                        for shape_id, shape_data in slide_data["shapes"].items():
-                            # 🎯 Text data
-                            if "txt" in shape_data:
-                                slide_changes[slide_id][shape_id] = {
-                                    "txt": shape_data["txt"]
-                                }
+                for shape_id, shape_data in slide_data["shapes"].items():
+                    # 🎯 Case 1: Text data
+                    if "txt" in shape_data:
+                        text_content = shape_data["txt"]
+                        changes[shape_id] = shape_changes[shape_id] = {
+                            "txt": text_content
+                        }
 
-                            # 🎯 Table data (NEW)
-                            if "table_data" in shape_data and shape_data["table_data"]:
-                                try:
-                                    table_json = shape_data["table_data"]
-                                    table_data = (
-                                        json.loads(table_json)
-                                        if isinstance(table_json, str)
-                                        else table_json
-                                    )
-
-                                    # Extract cell changes
-                                    cell_changes = {}
-                                    if isinstance(table_data, list):
-                                        for row_idx, row in enumerate(table_data):
-                                            if isinstance(row, list):
-                                                for col_idx, cell in enumerate(row):
-                                                    if (
-                                                        isinstance(cell, dict)
-                                                        and "text" in cell
-                                                    ):
-                                                        cell_key = (
-                                                            f"row{row_idx}_col{col_idx}"
-                                                        )
-                                                        cell_changes[cell_key] = {
-                                                            "row": row_idx,
-                                                            "col": col_idx,
-                                                            "text": cell.get(
-                                                                "text", ""
-                                                            ),
-                                                            "original_text": cell.get(
-                                                                "original_text", ""
-                                                            ),
-                                                        }
-
-                                    table_structure = {
-                                        "type": "table",
-                                        "changes": cell_changes,
-                                        "original_data": (
-                                            table_json
-                                            if isinstance(table_json, str)
-                                            else json.dumps(
-                                                table_json, ensure_ascii=False
-                                            )
-                                        ),
-                                        "rows": (
-                                            len(table_data)
-                                            if isinstance(table_data, list)
-                                            else 0
-                                        ),
-                                        "cols": (
-                                            len(table_data[0])
-                                            if (
-                                                isinstance(table_data, list)
-                                                and len(table_data) > 0
-                                                and isinstance(table_data[0], list)
-                                            )
-                                            else 0
-                                        ),
-                                    }
-
-                                    if shape_id in slide_changes[slide_id]:
-                                        # Already has text data
-                                        slide_changes[slide_id][shape_id][
-                                            "table"
-                                        ] = table_structure
-                                    else:
-                                        slide_changes[slide_id][
-                                            shape_id
-                                        ] = table_structure
-
-                                except (json.JSONDecodeError, TypeError) as e:
-                                    logger.debug(
-                                        f"❌ Failed to parse table data for {shape_id}: {e}"
-                                    )
+                        # debugging information
+                        if verbose:
+                            shape_type = shape_data.get("t", "unknown")
+                            logger.debug(
+                                f"  extract: slide={slide_id}, shape={shape_id}, type={shape_type}, textlength={len(text_content)}"
+                            )
 
-                except Exception as e:
-                    logger.debug(f"❌ deal with {filename} fail: {e}")
+                    # 🎯 Case 2: Table data (NEW)
+                    if shape_data.get("table_data"):
+                        # shape_data Comes from slide Parse cache：The table structure is built only once，
+                        # Reuse until file changes（Cache reload will generate new dict）
+                        table_structure = shape_data.get("_table_structure")
+                        if table_structure is None:
+                            try:
+                                table_structure = self._build_table_structure(
+                                    shape_data
+                                )
+                            except ValueError as e:
+                                # Only string table_data Will be parsed；json/orjson of
+                                # JSONDecodeError All are ValueError subclass
+                                logger.debug(
+                                    f"❌ Failed to parse table data for {shape_id}: {e}"
+                                )
+                                continue
+                            shape_data["_table_structure"] = table_structure
+
+                        # Handle shape with both text and table data
+                        if shape_id in shape_changes:
+                            # Already has text data, add table data
+                            shape_changes[shape_id]["table"] = table_structure
+                        else:
+                            # Only table data
+                            changes[shape_id] = shape_changes[shape_id] = (
+                                table_structure
+                            )
 
-            return slide_changes
+                        if verbose:
+                            logger.debug(
+                                f"  extract: slide={slide_id}, shape={shape_id}, table={table_structure['rows']}x{table_structure['cols']}, cells={len(table_structure['changes'])}"
+                            )
 
-        except Exception as e:
-            logger.debug(f"❌ fetch_changes_by_slidefail: {e}")
-            return {}
+            except ValueError as e:
+                logger.debug(f"❌ JSONParse error {filename}: {e}")
+            except Exception as e:
+                logger.debug(f"❌ Reading file error {filename}: {e}")
+
+        return changes, slide_changes
+
+    @staticmethod
+    def _build_table_structure(shape_data: dict) -> dict:
+        """
+        Build the table modification structure from the shape table_data.
+
+        Args:
+            shape_data (dict): slide JSON in shape data
+
+        Returns:
+            dict: {"type": "table", "changes": ..., "original_data": ..., "mod": ..., "rows": ..., "cols": ...}
+        """
+        # Parse table data（Judge the type first，Only strings need to be parsed and may throw ValueError）
+        # Stored as JSON str：The raw string is the original data，Just parse；
+        # Stored as structure：Serialize only once
+        table_json = shape_data["table_data"]
+        table_data = ProjectManager._parsed_table_data(shape_data)
+        if isinstance(table_json, str):
+            original_data = table_json
+        else:
+            original_data = _json_dumps(table_json)
+
+        # Extract cell changes（single layer comprehension，cell key is row{r}_col{c}）
+        is_table = isinstance(table_data, list)
+        cell_changes = (
+            {
+                f"row{row_idx}_col{col_idx}": {
+                    "row": row_idx,
+                    "col": col_idx,
+                    "text": cell["text"],
+                    "original_text": cell.get("original_text", ""),
+                }
+                for row_idx, row in enumerate(table_data)
+                if type(row) is list
+                for col_idx, cell in enumerate(row)
+                if type(cell) is dict and "text" in cell
+            }
+            if is_table
+            else {}
+        )
+
+        # Build table structure
+        return {
+            "type": "table",
+            "changes": cell_changes,
+            "original_data": original_data,
+            "mod": shape_data.get("mod", ""),
+            "rows": len(table_data) if is_table else 0,
+            "cols": (
+                len(table_data[0])
+                if is_table and table_data and isinstance(table_data[0], list)
+                else 0
+            ),
+        }
+
+    @staticmethod
+    def _parsed_table_data(shape_data: dict):
+        """
+        Parse shape of table_data，The result is cached in shape_data（The same data is only parsed once）.
+        shape_data Comes from slide Parse cache，Reparsing after the file changes will produce a new dict.
+
+        Args:
+            shape_data (dict): slide JSON in shape data
+
+        Returns:
+            Parsed table data（Shared object，Read only）
+
+        Raises:
+            ValueError: table_data Not legal JSON
+        """
+        table_data = shape_data.get("_table_parsed")
+        if table_data is None:
+            table_json = shape_data["table_data"]
+            table_data = (
+                _json_loads(table_json) if isinstance(table_json, str) else table_json
+            )
+            shape_data["_table_parsed"] = table_data
+        return table_data
+
+    @staticmethod
+    def _table_has_changes(shape_data: dict) -> bool:
+        """
+        Determine whether the table has content to be written back（Any cell has text，or differs from the original text）.
+        The result is cached with the parsed data in shape_data，Repeated exports are not traversed again.
+
+        Args:
+            shape_data (dict): slide JSON in shape data
+
+        Returns:
+            bool: Are there any changes
+
+        Raises:
+            ValueError: table_data Not legal JSON
+        """
+        has_changes = shape_data.get("_table_has_changes")
+        if has_changes is None:
+            table_data = ProjectManager._parsed_table_data(shape_data)
+            # Single-layer generator + any：Short circuit on first hit
+            has_changes = isinstance(table_data, list) and any(
+                cell["text"]
+                or ("original_text" in cell and cell["text"] != cell["original_text"])
+                for row in table_data
+                if isinstance(row, list)
+                for cell in row
+                if isinstance(cell, dict) and "text" in cell
+            )
+            shape_data["_table_has_changes"] = has_changes
+        return has_changes
 
     def get_changes_summary(self, session_id: str) -> dict:
         """
@@ -1265,8 +1702,10 @@ class ProjectManager:
         Returns:
             dict: Modify statistics
         """
-        all_changes = self.fetch_changes(session_id, merge_with_existing=True)
-        slide_changes = self.fetch_changes_by_slide(session_id)
+        # A single scan gets both the flat and by-slide views
+        all_changes, slide_changes = self._fetch_changes_views(
+            session_id, merge_with_existing=True
+        )
 
         # Statistics
         text_shapes = 0
@@ -1275,24 +1714,30 @@ class ProjectManager:
         total_cells_modified = 0
         total_text_length = 0
 
-        for shape_id, content in all_changes.items():
-            if isinstance(content, dict):
-                if "txt" in content and content.get("type") == "table":
+        # Single pass classification：Each content only takes it once type
+        for content in all_changes.values():
+            if not isinstance(content, dict):
+                continue
+            is_table = content.get("type") == "table"
+            if "txt" in content:
+                if is_table:
                     mixed_shapes += 1
-                elif "txt" in content:
-                    text_shapes += 1
-                    # Calculate text length
-                    if isinstance(content["txt"], str):
-                        total_text_length += len(content["txt"])
-                    elif isinstance(content["txt"], list):
-                        for item in content["txt"]:
-                            if isinstance(item, dict) and "text" in item:
-                                total_text_length += len(item["text"])
-                elif content.get("type") == "table":
-                    table_shapes += 1
-                    # Count modified cells
-                    if "changes" in content:
-                        total_cells_modified += len(content["changes"])
+                    continue
+                text_shapes += 1
+                # Calculate text length
+                txt = content["txt"]
+                if isinstance(txt, str):
+                    total_text_length += len(txt)
+                elif isinstance(txt, list):
+                    total_text_length += sum(
+                        len(item["text"])
+                        for item in txt
+                        if isinstance(item, dict) and "text" in item
+                    )
+            elif is_table:
+                table_shapes += 1
+                # Count modified cells
+                total_cells_modified += len(content.get("changes", ()))
 
         avg_text_length = total_text_length / text_shapes if text_shapes > 0 else 0
 
@@ -1391,113 +1836,107 @@ class ProjectManager:
         if not project:
             return False
 
-        project_dir = project["project_dir"]
-        slides_dir = os.path.join(project_dir, "slides")
+        slides_dir = project["slides_dir"]
 
-        # Find the slide file containing this shape
-        slide_idx = None
-        for filename in os.listdir(slides_dir):
-            if filename.endswith(".json"):
-                json_file = os.path.join(slides_dir, filename)
-                try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        slide_data = json.load(f)
+        # Find the slide file containing this shape（shape index，Rebuild once on miss）
+        for refresh in (False, True):
+            filename = self._locate_shape_file(project, shape_id, refresh)
+            if filename is None:
+                continue
+            json_file = os.path.join(slides_dir, filename)
+            try:
+                with open(json_file, "rb") as f:
+                    slide_data = _json_loads(f.read())
 
-                    if "shapes" in slide_data and shape_id in slide_data["shapes"]:
-                        # Extract slide index from filename
-                        slide_idx = int(
-                            filename.replace("slide_", "").replace(".json", "")
-                        )
+                if "shapes" in slide_data and shape_id in slide_data["shapes"]:
+                    # Merge changes
+                    shape_info = slide_data["shapes"][shape_id]
+                    if "table_data" in shape_info:
+                        try:
+                            table_data = _json_loads(shape_info["table_data"])
 
-                        # Merge changes
-                        shape_info = slide_data["shapes"][shape_id]
-                        if "table_data" in shape_info:
-                            try:
-                                table_data = json.loads(shape_info["table_data"])
+                            # Apply new changes
+                            for cell_key, cell_change in new_changes.items():
+                                if (
+                                    isinstance(cell_change, dict)
+                                    and "row" in cell_change
+                                    and "col" in cell_change
+                                ):
+                                    row = cell_change["row"]
+                                    col = cell_change["col"]
 
-                                # Apply new changes
-                                for cell_key, cell_change in new_changes.items():
                                     if (
-                                        isinstance(cell_change, dict)
-                                        and "row" in cell_change
-                                        and "col" in cell_change
+                                        isinstance(table_data, list)
+                                        and row < len(table_data)
+                                        and col < len(table_data[row])
+                                        and isinstance(table_data[row][col], dict)
                                     ):
-                                        row = cell_change["row"]
-                                        col = cell_change["col"]
-
-                                        if (
-                                            isinstance(table_data, list)
-                                            and row < len(table_data)
-                                            and col < len(table_data[row])
-                                            and isinstance(table_data[row][col], dict)
-                                        ):
-
-                                            table_data[row][col]["text"] = (
-                                                cell_change.get("text", "")
-                                            )
-
-                                # Save back
-                                shape_info["table_data"] = json.dumps(
-                                    table_data, ensure_ascii=False
-                                )
-                                shape_info["mod"] = datetime.datetime.now().isoformat()
 
-                                with open(json_file, "w", encoding="utf-8") as f:
-                                    json.dump(
-                                        slide_data, f, ensure_ascii=False, indent=2
-                                    )
+                                        table_data[row][col]["text"] = cell_change.get(
+                                            "text", ""
+                                        )
 
-                                logger.debug(f"✅ Merged table changes for {shape_id}")
-                                return True
+                            # Save back
+                            shape_info["table_data"] = _json_dumps(table_data)
+                            shape_info["mod"] = _now_iso()
 
-                            except (json.JSONDecodeError, TypeError, ValueError) as e:
-                                logger.debug(f"❌ Failed to merge table changes: {e}")
-                                return False
+                            self._write_slide_file(json_file, slide_data)
 
-                except Exception as e:
-                    logger.debug(f"❌ Error processing {filename}: {e}")
+                            logger.debug(f"✅ Merged table changes for {shape_id}")
+                            return True
+
+                        except (json.JSONDecodeError, TypeError, ValueError) as e:
+                            logger.debug(f"❌ Failed to merge table changes: {e}")
+                            return False
+                    # shape Not a table，No need to search again
+                    return False
+
+            except Exception as e:
+                logger.debug(f"❌ Error processing {filename}: {e}")
 
         return False
 
+    def _locate_shape_file(
+        self, project: dict, shape_id: str, refresh: bool = False
+    ) -> Optional[str]:
+        """
+        Find out by shape index shape The slide file name where it is located，Build on first use.
+
+        Args:
+            project: Project data
+            shape_id: shape ID
+            refresh: Whether to rescan slides Table of contents rebuild index
+
+        Returns:
+            Optional[str]: slide JSON file name，Return if not foundNone
+        """
+        index = project.get("shape_index")
+        if index is None or refresh:
+            index = {}
+            slides_dir = project["slides_dir"]
+            with os.scandir(slides_dir) as entries:
+                json_files = [
+                    (e.name, e.path)
+                    for e in entries
+                    if e.name.endswith(".json") and e.is_file()
+                ]
+            loaded = self._load_slide_jsons([json_file for _, json_file in json_files])
+            for (filename, _), slide_data in zip(json_files, loaded):
+                if isinstance(slide_data, dict):
+                    for sid in slide_data.get("shapes") or ():
+                        index.setdefault(sid, filename)
+            project["shape_index"] = index
+            logger.debug(f"🗂️ shapeIndex construction completed: {len(index)} indivual")
+        return index.get(shape_id)
+
     def get_app_data_dir(self) -> str:
         """
-        Get the application data directory.
+        Get the application data directory（Calculated only once per process）.
 
         Returns:
             str: Cross-platform application data directory path
         """
-        try:
-            # Try using platformdirs
-            import platformdirs
-
-            return platformdirs.user_data_dir("PPTeXpress", "Paradoxsolver")
-        except ImportError:
-            # Fallback plan
-            if os.name == "nt":  # Windows
-                base_dir = os.getenv(
-                    "LOCALAPPDATA",
-                    os.path.join(os.path.expanduser("~"), "AppData", "Local"),
-                )
-                return os.path.join(base_dir, "PPTeXpress", "projects")
-            elif os.name == "posix":  # Linux/Mac
-                if sys.platform == "darwin":  # macOS
-                    return os.path.join(
-                        os.path.expanduser("~"),
-                        "Library",
-                        "Application Support",
-                        "PPTeXpress",
-                        "projects",
-                    )
-                else:  # Linux
-                    return os.path.join(
-                        os.path.expanduser("~"),
-                        ".local",
-                        "share",
-                        "pptexpress",
-                        "projects",
-                    )
-            else:
-                return os.path.join(os.path.expanduser("~"), "PPTeXpress", "projects")
+        return _compute_app_data_dir()
 
     def get_recent_projects(self, limit: int = 10) -> list:
         """
@@ -1515,73 +1954,69 @@ class ProjectManager:
                 return []
 
             # Get all subdirectories（session_idTable of contents）
-            projects = []
-            for directory_name in os.listdir(app_data_dir):
-                project_dir = os.path.join(app_data_dir, directory_name)
-
-                # Check if it is a directory
-                if os.path.isdir(project_dir):
-                    yaml_path = os.path.join(project_dir, "project.yaml")
-                    if os.path.exists(yaml_path):
-                        try:
-                            # read project.yaml
-                            with open(yaml_path, "r", encoding="utf-8") as f:
-                                project_data = yaml.safe_load(f)
+            # scandir Comes with file type，Directory judgment needs no extra stat
+            candidates = []
+            with os.scandir(app_data_dir) as it:
+                project_entries = [entry for entry in it if entry.is_dir()]
+
+            for entry in project_entries:
+                directory_name = entry.name
+                yaml_path = os.path.join(entry.path, "project.yaml")
+                try:
+                    # read project.yaml（Skip if it does not exist，no exists probe）
+                    # Repeat scan reuses cached parse when the file is unchanged（Read only）
+                    try:
+                        project_data = self._load_yaml_cached(yaml_path)
+                    except FileNotFoundError:
+                        continue
 
-                            if not project_data or "project" not in project_data:
-                                continue
+                    if not project_data or "project" not in project_data:
+                        continue
 
-                            # 🔧 Revise：session_idIt’s the directory name
-                            project_id = project_data["project"].get(
-                                "id", directory_name[:8]
-                            )
-                            last_modified = os.path.getmtime(project_dir)
-
-                            # Get project information
-                            project_info = {
-                                "session_id": directory_name,  # 🔧 session_idIt’s the directory name
-                                "project_dir": project_dir,
-                                "name": project_data["project"].get(
-                                    "name", "Unnamed project"
-                                ),
-                                "id": project_id,
-                                "created_at": project_data["project"].get(
-                                    "created_at", ""
-                                ),
-                                "modified_at": project_data["project"].get(
-                                    "modified_at", ""
-                                ),
-                                "last_opened": datetime.datetime.fromtimestamp(
-                                    last_modified
-                                ).isoformat(),
-                                "valid": True,
-                            }
+                    candidates.append(
+                        (entry.stat().st_mtime, entry, project_data["project"])
+                    )
 
-                            # statisticsslidequantity
-                            slides_dir = os.path.join(project_dir, "slides")
-                            if os.path.exists(slides_dir):
-                                slide_files = [
-                                    f
-                                    for f in os.listdir(slides_dir)
-                                    if f.endswith(".json")
-                                ]
-                                project_info["slide_count"] = len(slide_files)
-                            else:
-                                project_info["slide_count"] = 0
-
-                            projects.append(project_info)
-
-                        except Exception as e:
-                            logger.debug(
-                                f"⚠️ Processing project failed {directory_name}: {e}"
-                            )
-                            continue
+                except Exception as e:
+                    logger.debug(f"⚠️ Processing project failed {directory_name}: {e}")
+                    continue
 
-            # Sort by last modified time in descending order
-            projects.sort(key=lambda x: x.get("last_opened", ""), reverse=True)
+            # Take the latest by numerical modification time limit indivual（O(N log limit)），
+            # Only the retained items are formatted and counted slide
+            recent_projects = []
+            for last_modified, entry, project_meta in heapq.nlargest(
+                limit, candidates, key=lambda c: c[0]
+            ):
+                directory_name = entry.name
+                project_dir = entry.path
+                try:
+                    # 🔧 Revise：session_idIt’s the directory name
+                    project_id = project_meta.get("id", directory_name[:8])
+
+                    # Get project information
+                    project_info = {
+                        "session_id": directory_name,  # 🔧 session_idIt’s the directory name
+                        "project_dir": project_dir,
+                        "name": project_meta.get("name", "Unnamed project"),
+                        "id": project_id,
+                        "created_at": project_meta.get("created_at", ""),
+                        "modified_at": project_meta.get("modified_at", ""),
+                        "last_opened": datetime.datetime.fromtimestamp(
+                            last_modified
+                        ).isoformat(),
+                        "valid": True,
+                    }
 
-            # Limit the number of returns
-            recent_projects = projects[:limit]
+                    # statisticsslidequantity
+                    project_info["slide_count"] = self._count_slide_files(
+                        os.path.join(project_dir, "slides")
+                    )
+
+                    recent_projects.append(project_info)
+
+                except Exception as e:
+                    logger.debug(f"⚠️ Processing project failed {directory_name}: {e}")
+                    continue
 
             logger.debug(
                 f"✅ Get recent project completions: {len(recent_projects)} items"
@@ -1596,6 +2031,31 @@ class ProjectManager:
             traceback.print_exc()
             return []
 
+    def _count_slide_files(self, slides_dir: str) -> int:
+        """
+        statistics slides In the directory JSON Number of files，Directory mtime Reuse last result when unchanged.
+
+        Args:
+            slides_dir: slidesTable of contents
+
+        Returns:
+            int: slide Number of files（Return if the directory does not exist0）
+        """
+        try:
+            mtime_ns = os.stat(slides_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._slide_count_cache.pop(slides_dir, None)
+            return 0
+
+        cached = self._slide_count_cache.get(slides_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        with os.scandir(slides_dir) as it:
+            count = sum(1 for slide in it if slide.name.endswith(".json"))
+        self._slide_count_cache[slides_dir] = (mtime_ns, count)
+        return count
+
     def get_image_path(self, session_id: str, image_filename: str) -> str:
         """
         Get the full path of the image file.
@@ -1612,9 +2072,10 @@ class ProjectManager:
             return ""
 
         assets_dir = project.get("assets_dir")
-        if not assets_dir or not os.path.exists(assets_dir):
+        if not assets_dir:
             return ""
 
+        # Missing directory means missing image：One probe is enough
         image_path = os.path.join(assets_dir, image_filename)
         return image_path if os.path.exists(image_path) else ""
 
@@ -1646,27 +2107,33 @@ class ProjectManager:
             return {"error": "Project does not exist"}
 
         assets_dir = project.get("assets_dir")
-        if not assets_dir or not os.path.exists(assets_dir):
+        if not assets_dir:
             return {"images_dir": assets_dir, "count": 0, "files": []}
 
         images = []
+        fromtimestamp = datetime.datetime.fromtimestamp
         try:
-            for filename in os.listdir(assets_dir):
-                filepath = os.path.join(assets_dir, filename)
-                if os.path.isfile(filepath) and filename.lower().endswith(
-                    (".png", ".jpg", ".jpeg", ".gif", ".bmp")
-                ):
-                    stat_info = os.stat(filepath)
-                    images.append(
-                        {
-                            "filename": filename,
-                            "size_bytes": stat_info.st_size,
-                            "last_modified": datetime.datetime.fromtimestamp(
-                                stat_info.st_mtime
-                            ).isoformat(),
-                            "url_path": f"/api/project/{session_id}/image/{filename}",
-                        }
-                    )
+            # scandir of DirEntry Comes with file type，stat Only one time per picture
+            with os.scandir(assets_dir) as it:
+                image_entries = [
+                    entry
+                    for entry in it
+                    if _is_image_name(entry.name) and entry.is_file()
+                ]
+            for entry in image_entries:
+                filename = entry.name
+                stat_info = entry.stat()
+                images.append(
+                    {
+                        "filename": filename,
+                        "size_bytes": stat_info.st_size,
+                        "last_modified": fromtimestamp(stat_info.st_mtime).isoformat(),
+                        "url_path": f"/api/project/{session_id}/image/{filename}",
+                    }
+                )
+        except FileNotFoundError:
+            # Directory does not exist：Treat as no image（EAFP）
+            return {"images_dir": assets_dir, "count": 0, "files": []}
         except Exception as e:
             logger.debug(f"❌ Failed to list images: {e}")
 
@@ -1696,20 +2163,36 @@ class ProjectManager:
         try:
             # Clean up filenames，Prevent path traversal attacks
             safe_filename = os.path.basename(filename)
-            # Add timestamp to prevent duplicate names
-            import time
-
+            # Content hash prevents duplicate names：different content，different names；
+            # Re-uploading the same picture hits the existing file，no rewrite
             name, ext = os.path.splitext(safe_filename)
-            timestamp = int(time.time())
-            final_filename = f"uploaded_{timestamp}_{name}{ext}"
+            digest = hashlib.blake2b(image_data, digest_size=8).hexdigest()
+            final_filename = f"uploaded_{digest}_{name}{ext}"
 
             filepath = os.path.join(assets_dir, final_filename)
 
-            with open(filepath, "wb") as f:
-                f.write(image_data)
+            try:
+                stat_info = os.stat(filepath)
+                reused = stat_info.st_size == len(image_data)
+            except FileNotFoundError:
+                reused = False
 
-            # Get file information
-            stat_info = os.stat(filepath)
+            if reused:
+                logger.debug(f"♻️ Same picture already exists，Skip: {final_filename}")
+            else:
+                # Unbuffered write to fd（No intermediate copy），stat from the same fd
+                fd = os.open(
+                    filepath,
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                    0o644,
+                )
+                try:
+                    view = memoryview(image_data)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                    stat_info = os.fstat(fd)
+                finally:
+                    os.close(fd)
 
             return {
                 "success": True,
@@ -1739,8 +2222,10 @@ class ProjectManager:
         """
         try:
             # if already exists，Return directly
-            if session_id in self.git_managers:
-                return self.git_managers[session_id]
+            git_manager = self.git_managers.get(session_id)
+            if git_manager is not None:
+                self.git_managers.move_to_end(session_id)
+                return git_manager
 
             # Get project data
             project = self.get_project_by_session(session_id)
@@ -1759,7 +2244,7 @@ class ProjectManager:
 
             # createGitManagerExample
             git_manager = GitManager(project_dir)
-            self.git_managers[session_id] = git_manager
+            self._remember_git_manager(session_id, git_manager)
 
             logger.debug(f"✅ createGitManager: {session_id}")
             return git_manager
@@ -1768,6 +2253,22 @@ class ProjectManager:
             logger.debug(f"❌ GetGitManagerfail: {e}")
             return None
 
+    def _remember_git_manager(self, session_id: str, git_manager: GitManager):
+        """
+        Record GitManager，exceed MAX_GIT_MANAGERS When the longest unused one is evicted.
+        Only the resident cat-file process is closed when evicting（Will be restarted on demand when used again）.
+
+        Args:
+            session_id: sessionID
+            git_manager: GitManagerExample
+        """
+        self.git_managers[session_id] = git_manager
+        self.git_managers.move_to_end(session_id)
+        while len(self.git_managers) > self.MAX_GIT_MANAGERS:
+            evicted_id, evicted = self.git_managers.popitem(last=False)
+            evicted.close_catfile_processes()
+            logger.debug(f"♻️ Evict long-unused GitManager: {evicted_id}")
+
     def init_project_git(self, session_id: str, force: bool = False) -> Dict[str, Any]:
         """
         Initialize the projectGitstorehouse
@@ -1830,12 +2331,9 @@ class ProjectManager:
 
             # If created successfully，Update project modification time
             if result.get("success"):
+                # update_project_yaml Comes with modified_at renew，No need to pass it again
                 self.update_project_yaml(
-                    session_id,
-                    {
-                        "project.modified_at": datetime.datetime.now().isoformat(),
-                        "project.last_snapshot": result.get("short_hash"),
-                    },
+                    session_id, {"project.last_snapshot": result.get("short_hash")}
                 )
 
             return result
@@ -1942,19 +2440,23 @@ class ProjectManager:
                 return False
 
             # reloadproject.yaml
-            yaml_path = os.path.join(project_dir, "project.yaml")
-            if os.path.exists(yaml_path):
-                with open(yaml_path, "r", encoding="utf-8") as f:
-                    project_data = yaml.safe_load(f)
-
-                # Update project data in memory
-                if project.get("project_data"):
-                    project["project_data"] = project_data
+            yaml_path = project["yaml_path"]
+            # Restored file may keep mtime/size：Drop the cache and parse again
+            self._yaml_cache.pop(yaml_path, None)
+            try:
+                # Copy the cached parse：Memory data will be modified in place later
+                project_data = copy.deepcopy(self._load_yaml_cached(yaml_path))
+            except FileNotFoundError:
+                return False
 
-                logger.debug(f"🔄 Project data has been reloaded")
-                return True
+            # Update project data in memory
+            if project.get("project_data"):
+                project["project_data"] = project_data
+            # slide The file has been replaced by snapshot，shape Index needs to be rebuilt
+            project.pop("shape_index", None)
 
-            return False
+            logger.debug(f"🔄 Project data has been reloaded")
+            return True
 
         except Exception as e:
             logger.debug(f"⚠️ Reloading project data failed: {e}")
@@ -1997,8 +2499,9 @@ class ProjectManager:
             Is the cleanup successful?
         """
         try:
-            if session_id in self.git_managers:
-                del self.git_managers[session_id]
+            git_manager = self.git_managers.pop(session_id, None)
+            if git_manager is not None:
+                git_manager.close_catfile_processes()
                 logger.debug(f"🗑️ clean upGitManager: {session_id}")
                 return True
             return False
@@ -2073,6 +2576,64 @@ class ProjectManager:
             logger.debug(f"❌ {error_msg}")
             return {"success": False, "message": error_msg, "ready_for_deletion": False}
 
+    @contextlib.contextmanager
+    def batch_slide_writes(self):
+        """
+        Batch slide write：within the block save_structured_data_to_json / save_table_changes
+        Modify only the buffered slide data，When exiting, each modified slide file is only written once.
+        Nested use reuses the outer buffer.
+        """
+        if getattr(self._slide_batch, "buffer", None) is not None:
+            yield
+            return
+
+        buffer = self._slide_batch.buffer = {}
+        dirty = self._slide_batch.dirty = set()
+        try:
+            yield
+        finally:
+            self._slide_batch.buffer = None
+            self._slide_batch.dirty = None
+            for slide_path in dirty:
+                self._write_slide_file(slide_path, buffer[slide_path])
+            if dirty:
+                logger.debug(f"💾 Batch write completed: {len(dirty)} indivualslidedocument")
+
+    def _read_slide_for_update(self, slide_path: str) -> dict:
+        """
+        Read slide data to be modified（Private copy；Reuse buffered data in batch write）.
+
+        Args:
+            slide_path: slide JSON file path
+
+        Returns:
+            dict: Modifiable slide data
+        """
+        buffer = getattr(self._slide_batch, "buffer", None)
+        if buffer is not None and slide_path in buffer:
+            return buffer[slide_path]
+
+        with open(slide_path, "rb") as f:
+            slide_data = _json_loads(f.read())
+        if buffer is not None:
+            buffer[slide_path] = slide_data
+        return slide_data
+
+    def _write_slide_after_update(self, slide_path: str, slide_data: dict):
+        """
+        Write back the modified slide data；Only marked as dirty during batch write，Written uniformly on exit.
+
+        Args:
+            slide_path: slide JSON file path
+            slide_data: Modified slide data
+        """
+        dirty = getattr(self._slide_batch, "dirty", None)
+        if dirty is not None:
+            dirty.add(slide_path)
+            return
+
+        self._write_slide_file(slide_path, slide_data)
+
     def save_structured_data_to_json(
         self, project_dir, slide_idx, shape_id, structured_data
     ):
@@ -2087,9 +2648,8 @@ class ProjectManager:
                 logger.debug(f"❌ SlideFile does not exist: {slide_path}")
                 return False
 
-            # Read existing data
-            with open(slide_path, "r", encoding="utf-8") as f:
-                slide_data = json.load(f)
+            # Read existing data（Reuse buffered data in batch write）
+            slide_data = self._read_slide_for_update(slide_path)
 
             # Update designationshapestructured data
             if "shapes" in slide_data and shape_id in slide_data["shapes"]:
@@ -2097,13 +2657,10 @@ class ProjectManager:
                 slide_data["shapes"][shape_id]["txt"] = structured_data
 
                 # Set modification timestamp
-                slide_data["shapes"][shape_id][
-                    "mod"
-                ] = datetime.datetime.now().isoformat()
+                slide_data["shapes"][shape_id]["mod"] = _now_iso()
 
-                # write back file
-                with open(slide_path, "w", encoding="utf-8") as f:
-                    json.dump(slide_data, f, ensure_ascii=False, indent=2)
+                # write back file（Write only once at the end of batch write）
+                self._write_slide_after_update(slide_path, slide_data)
 
                 logger.debug(f"✅ Structured data saved to: {slide_path}")
                 return True
@@ -2129,9 +2686,8 @@ class ProjectManager:
                 logger.debug(f"❌ Slide file not found: {slide_path}")
                 return False
 
-            # Read existing data
-            with open(slide_path, "r", encoding="utf-8") as f:
-                slide_data = json.load(f)
+            # Read existing data（Reuse buffered data in batch write）
+            slide_data = self._read_slide_for_update(slide_path)
 
             # Check if the shape exists
             if "shapes" not in slide_data or shape_id not in slide_data["shapes"]:
@@ -2143,39 +2699,44 @@ class ProjectManager:
             # Parse tabular data
             try:
                 if "table_data" in shape_info:
-                    table_data = json.loads(shape_info["table_data"])
+                    table_data = _json_loads(shape_info["table_data"])
                 else:
-                    table_data = json.loads(original_data)
-            except json.JSONDecodeError:
+                    table_data = _json_loads(original_data)
+            except ValueError:
                 logger.debug(f"❌ Failed to parse table data for {shape_id}")
                 return False
 
             # Apply changes
             modified_cells = 0
-            for cell_id, cell_change in changes.items():
+            # Type check and row length are calculated only once outside the loop
+            rows = table_data if isinstance(table_data, list) else ()
+            row_lens = [len(row) for row in rows]
+            row_count = len(row_lens)
+            for cell_change in changes.values():
                 # parse cellIDFormat: cell_changeshould containrowandcol
                 if "row" in cell_change and "col" in cell_change:
                     row_idx = cell_change["row"]
                     col_idx = cell_change["col"]
 
                     # Make sure the index is valid
-                    if (
-                        isinstance(table_data, list)
-                        and row_idx < len(table_data)
-                        and col_idx < len(table_data[row_idx])
-                    ):
-
-                        table_data[row_idx][col_idx]["text"] = cell_change.get(
-                            "text", ""
-                        )
-                        modified_cells += 1
+                    if row_idx < row_count and col_idx < row_lens[row_idx]:
+                        # Only count cells whose text actually changes
+                        cell = rows[row_idx][col_idx]
+                        new_text = cell_change.get("text", "")
+                        if cell.get("text") != new_text:
+                            cell["text"] = new_text
+                            modified_cells += 1
+
+            # No cells changed：Skip serialization and write back（Keep the original mod）
+            if modified_cells == 0 and "table_data" in shape_info:
+                logger.debug(f"⏭️ Table unchanged, skip write: {shape_id}")
+                return True
 
             # update and save
-            shape_info["table_data"] = json.dumps(table_data, ensure_ascii=False)
-            shape_info["mod"] = datetime.datetime.now().isoformat()
+            shape_info["table_data"] = _json_dumps(table_data)
+            shape_info["mod"] = _now_iso()
 
-            with open(slide_path, "w", encoding="utf-8") as f:
-                json.dump(slide_data, f, ensure_ascii=False, indent=2)
+            self._write_slide_after_update(slide_path, slide_data)
 
             logger.debug(f"✅ Table changes saved: {shape_id} ({modified_cells} cells)")
             return True
@@ -2203,9 +2764,8 @@ class ProjectManager:
             raise RuntimeError("This session has no associated project directory")
 
         # Load project configuration
-        yaml_path = os.path.join(project_dir, "project.yaml")
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            project_data = yaml.safe_load(f)
+        yaml_path = project_data_obj["yaml_path"]
+        project_data = self._load_yaml_cached(yaml_path)
 
         template_file = project_data["template"]["file"]
         template_path = os.path.join(project_dir, template_file)
@@ -2216,107 +2776,141 @@ class ProjectManager:
         # Load modifications
         structured_changes = {}
         table_changes = {}
-        slides_dir = os.path.join(project_dir, "slides")
+        slides_dir = project_data_obj["slides_dir"]
 
-        if os.path.exists(slides_dir):
-            for filename in sorted(os.listdir(slides_dir)):
-                if filename.endswith(".json"):
-                    slide_path = os.path.join(slides_dir, filename)
-                    try:
-                        with open(slide_path, "r", encoding="utf-8") as f:
-                            slide_data = json.load(f)
-
-                        if "shapes" in slide_data:
-                            for shape_id, shape_info in slide_data["shapes"].items():
-                                # text data
-                                if "txt" in shape_info and isinstance(
-                                    shape_info["txt"], list
-                                ):
-                                    structured_changes[shape_id] = shape_info["txt"]
-
-                                # tabular data
-                                if (
-                                    "table_data" in shape_info
-                                    and shape_info["table_data"]
-                                ):
-                                    try:
-                                        table_json = shape_info["table_data"]
-                                        table_data = (
-                                            json.loads(table_json)
-                                            if isinstance(table_json, str)
-                                            else table_json
-                                        )
-
-                                        has_changes = False
-                                        if isinstance(table_data, list):
-                                            for row in table_data:
-                                                if isinstance(row, list):
-                                                    for cell in row:
-                                                        if (
-                                                            isinstance(cell, dict)
-                                                            and "text" in cell
-                                                        ):
-                                                            if (
-                                                                "original_text" in cell
-                                                                and cell.get("text")
-                                                                != cell.get(
-                                                                    "original_text"
-                                                                )
-                                                            ):
-                                                                has_changes = True
-                                                            elif (
-                                                                "text" in cell
-                                                                and cell["text"]
-                                                            ):
-                                                                has_changes = True
-
-                                        if has_changes:
-                                            table_changes[shape_id] = table_data
-
-                                    except (json.JSONDecodeError, TypeError):
-                                        pass
-                    except Exception:
-                        continue
+        # Missing directory is treated as no modification（EAFP，No need to exists Probe first）
+        try:
+            with os.scandir(slides_dir) as entries:
+                json_files = sorted(e.path for e in entries if e.name.endswith(".json"))
+        except FileNotFoundError:
+            json_files = []
+        # Take the slide parse cache：Unchanged files are not read or parsed again（Read only）
+        for slide_data in self._load_slide_jsons(json_files):
+            if not isinstance(slide_data, dict) or "shapes" not in slide_data:
+                continue
+            for shape_id, shape_info in slide_data["shapes"].items():
+                # text data
+                if "txt" in shape_info and isinstance(shape_info["txt"], list):
+                    structured_changes[shape_id] = shape_info["txt"]
+
+                # tabular data
+                if not shape_info.get("table_data"):
+                    continue
+                try:
+                    if self._table_has_changes(shape_info):
+                        table_changes[shape_id] = self._parsed_table_data(shape_info)
+                except (ValueError, TypeError):
+                    continue
 
         # Load image modification
         assets_dir = os.path.join(project_dir, "assets", "images")
         image_modifications = {}
 
-        if os.path.exists(assets_dir):
-            try:
-                images_json_path = os.path.join(project_dir, "images.json")
-                if os.path.exists(images_json_path):
-                    with open(images_json_path, "r", encoding="utf-8") as f:
-                        images_data = json.load(f)
-
-                    for shape_id, image_info in images_data.items():
-                        if "image_ref" in image_info:
-                            image_path = os.path.join(
-                                assets_dir, image_info["image_ref"]
-                            )
-                            if os.path.exists(image_path):
-                                image_modifications[shape_id] = image_path
-            except Exception:
-                pass
+        # images.json Skip directly if it does not exist（Caught by exception，No probing first）
+        images_json_path = os.path.join(project_dir, "images.json")
+        try:
+            with open(images_json_path, "rb") as f:
+                images_data = _json_loads(f.read())
+
+            for shape_id, image_info in images_data.items():
+                if "image_ref" in image_info:
+                    image_path = os.path.join(assets_dir, image_info["image_ref"])
+                    if os.path.exists(image_path):
+                        image_modifications[shape_id] = image_path
+        except Exception:
+            pass
+
+        # Inputs（template/slide/images.json/picture）unchanged：Reuse last generated file
+        build_key = self._stat_signature(
+            [
+                template_path,
+                images_json_path,
+                *json_files,
+                *image_modifications.values(),
+            ]
+        )
+        cached = self._pptx_cache.get(session_id)
+        if cached is not None and cached[0] == build_key and os.path.exists(cached[1]):
+            logger.debug(f"♻️ Input unchanged，Reuse generatedPPTX: {cached[1]}")
+            return cached[1]
+
+        # Sequential naming in the build directory（No temporary file per build）
+        pptx_path = os.path.join(
+            _build_work_dir(), f"build_{next(_BUILD_COUNTER):08d}.pptx"
+        )
+
+        # No modification：Copy the template directly，Skip parsing and reserialization
+        if not (structured_changes or table_changes or image_modifications):
+            shutil.copyfile(template_path, pptx_path)
+            logger.debug(f"📄 No changes，Copy template directly: {pptx_path}")
+            self._pptx_cache[session_id] = (build_key, pptx_path)
+            return pptx_path
 
         # Apply changes and buildPPTX
-        prs = Presentation(template_path)
+        prs = Presentation(io.BytesIO(self._load_template_blob(template_path)))
         editor = PPTXFormEditor(template_path)
 
+        # Three kinds of modifications share the shape list（Modified in place，Index unchanged）
+        shapes_cache = {}
+
         if structured_changes:
-            editor.apply_structured_changes_to_pptx(prs, structured_changes)
+            editor.apply_structured_changes_to_pptx(
+                prs, structured_changes, shapes_cache
+            )
 
         if table_changes:
-            editor.apply_table_changes_to_pptx(prs, table_changes)
+            editor.apply_table_changes_to_pptx(prs, table_changes, shapes_cache)
 
         if image_modifications:
-            for shape_id, image_path in image_modifications.items():
-                editor.apply_image_to_pptx(prs, shape_id, image_path)
+            editor.apply_images_to_pptx(prs, image_modifications, shapes_cache)
 
-        # Create temporary files
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pptx")
-        pptx_path = temp_file.name
         prs.save(pptx_path)
-        temp_file.close()
 
+        self._pptx_cache[session_id] = (build_key, pptx_path)
         return pptx_path
+
+    def _load_template_blob(self, template_path: str) -> bytes:
+        """
+        Read template file bytes，document（mtime/size）Reuse cache when unchanged.
+
+        Args:
+            template_path: Template file path
+
+        Returns:
+            bytes: Template file content（Read only）
+        """
+        st = os.stat(template_path)
+        cached = self._template_blob_cache.get(template_path)
+        if cached is not None and (st.st_mtime_ns, st.st_size) == cached[:2]:
+            self._template_blob_cache.move_to_end(template_path)
+            return cached[2]
+
+        with open(template_path, "rb") as f:
+            blob = f.read()
+
+        self._template_blob_cache[template_path] = (st.st_mtime_ns, st.st_size, blob)
+        self._template_blob_cache.move_to_end(template_path)
+        if len(self._template_blob_cache) > self.MAX_CACHED_TEMPLATES:
+            self._template_blob_cache.popitem(last=False)
+        return blob
+
+    @staticmethod
+    def _stat_signature(paths: list) -> tuple:
+        """
+        Generate a file status signature（path、inode、mtime、size）；Missing files are recorded as None.
+        Atomic replacement generates a new inode，Coarse-grained mtime Changes can also be identified.
+
+        Args:
+            paths: file path list
+
+        Returns:
+            tuple: Can be compared for equality signature
+        """
+        signature = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                signature.append((path, st.st_ino, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((path, None))
+        return tuple(signature)
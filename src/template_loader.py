@@ -1,30 +1,54 @@
 import os
+import re
+import time
 from pathlib import Path
 
+# Template placeholders {{key}}
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
 
 class TemplateLoader:
+    # Template file status recheck interval（Second）；Return cache directly within it
+    STAT_TTL = 1.0
+
     def __init__(self, template_dir="templates"):
         self.template_dir = Path(template_dir)
+        self._cache = {}  # template_name -> (st_mtime_ns, st_size, text)
+        self._checked_at = {}  # template_name -> monotonic timestamp of last stat
 
     def load_template(self, template_name):
-        """Load template file"""
+        """Load template file（document mtime/size Return cached content when unchanged）"""
+        cached = self._cache.get(template_name)
+        now = time.monotonic()
+        if cached is not None and now - self._checked_at[template_name] < self.STAT_TTL:
+            return cached[2]
+
         template_path = self.template_dir / template_name
-        if template_path.exists():
-            with open(template_path, "r", encoding="utf-8") as f:
-                return f.read()
-        else:
+        try:
+            st = os.stat(template_path)
+        except FileNotFoundError:
+            self._cache.pop(template_name, None)
             raise FileNotFoundError(f"Template file does not exist: {template_path}")
 
+        self._checked_at[template_name] = now
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
+        with open(template_path, "r", encoding="utf-8") as f:
+            template = f.read()
+        self._cache[template_name] = (st.st_mtime_ns, st.st_size, template)
+        return template
+
     def render_template(self, template_name, **context):
         """render template"""
         template = self.load_template(template_name)
 
-        # Simple template variable replacement
-        for key, value in context.items():
-            placeholder = "{{" + key + "}}"
-            template = template.replace(placeholder, str(value))
+        # Simple template variable replacement（Single scan；Placeholders not in context remain as is）
+        def substitute(match):
+            key = match.group(1)
+            return str(context[key]) if key in context else match.group(0)
 
-        return template
+        return _PLACEHOLDER_RE.sub(substitute, template)
 
 
 # Create a global template loader
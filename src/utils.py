@@ -1,5 +1,7 @@
 import os
 import hashlib
+import functools
+import mmap
 import time
 import stat
 import shutil
@@ -8,15 +10,35 @@ import logging
 
 
 def setup_logger(name="app"):
-    """Create and return a configuredlogger"""
+    """Create and return logger（Silent by default，see configure_console_logging）"""
     logger = logging.getLogger(name)
 
     # Avoid duplicate additionshandler（important！）
-    if logger.handlers:
-        return logger
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+
+    return logger
+
+
+def configure_console_logging(name="PPTeXpress", level=None):
+    """
+    for logger Install console output（Repeated calls do not add more handler）
+
+    Args:
+        name: logger name
+        level: Log level；Read PPTEXPRESS_LOG_LEVEL when not provided（default INFO）
+
+    Returns:
+        Configured logger
+    """
+    logger = logging.getLogger(name)
 
-    log_level = "INFO"
-    logger.setLevel(getattr(logging, log_level.upper()))
+    if level is None:
+        level = os.getenv("PPTEXPRESS_LOG_LEVEL", "INFO")
+    logger.setLevel(getattr(logging, str(level).upper(), logging.INFO))
+
+    if any(type(h) is logging.StreamHandler for h in logger.handlers):
+        return logger
 
     # console output
     console_handler = logging.StreamHandler(sys.stdout)
@@ -33,29 +55,50 @@ def setup_logger(name="app"):
 logger = setup_logger("PPTeXpress")
 
 
-def cleanup_temp_files(pptx_temp_file, pdf_temp_file):
-    """Clean temporary files"""
+def cleanup_temp_files(*temp_files):
+    """Clean temporary files（objects with a name attribute；Missing files are ignored）"""
+    for temp_file in temp_files:
+        name = getattr(temp_file, "name", None)
+        if not name:
+            continue
+        try:
+            os.unlink(name)
+            logger.debug(f"🗑️ Temporary file deleted: {name}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to delete temporary file {name}: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _aspose_slides():
+    """Import Aspose.Slides once per process（Return None if not installed）"""
     try:
-        if (
-            pptx_temp_file
-            and hasattr(pptx_temp_file, "name")
-            and os.path.exists(pptx_temp_file.name)
-        ):
-            os.unlink(pptx_temp_file.name)
-            print(f"🗑️ Temporary deletedPPTX: {pptx_temp_file.name}")
-    except Exception as e:
-        print(f"⚠️ Delete temporaryPPTXfail: {e}")
+        import aspose.slides as slides
+    except ImportError:
+        return None
+    return slides
 
+
+def warmup_pdf_converter():
+    """
+    Preheat Aspose.Slides：Import and create an empty presentation，
+    Avoid the first conversion paying the startup overhead.
+
+    Returns:
+        bool: Whether the warm-up was successful
+    """
+    slides = _aspose_slides()
+    if slides is None:
+        return False
     try:
-        if (
-            pdf_temp_file
-            and hasattr(pdf_temp_file, "name")
-            and os.path.exists(pdf_temp_file.name)
-        ):
-            os.unlink(pdf_temp_file.name)
-            print(f"🗑️ Temporary deletedPDF: {pdf_temp_file.name}")
+        with slides.Presentation():
+            pass
+        logger.debug("🔥 PDFConverter warmed up")
+        return True
     except Exception as e:
-        print(f"⚠️ Delete temporaryPDFfail: {e}")
+        logger.debug(f"⚠️ PDFConverter warm-up failed: {e}")
+        return False
 
 
 def convert_pptx_to_pdf(pptx_path, pdf_path):
@@ -63,65 +106,118 @@ def convert_pptx_to_pdf(pptx_path, pdf_path):
     max_retries = 3
     retry_delay = 1  # Second
 
+    slides = _aspose_slides()
+    if slides is None:
+        logger.debug("❌ Aspose.Slides Not installed，Unable to convertPDF")
+        return False
+
     for attempt in range(max_retries):
         try:
-            print(f"🔄 conversion attempt {attempt + 1}/{max_retries}")
+            logger.debug(f"🔄 conversion attempt {attempt + 1}/{max_retries}")
 
             # Check if file is accessible
             if not os.path.exists(pptx_path):
-                print(f"❌ PPTXFile does not exist: {pptx_path}")
+                logger.debug(f"❌ PPTXFile does not exist: {pptx_path}")
                 return False
 
-            import aspose.slides as slides
-
             # Use different loading methods
             with slides.Presentation(pptx_path) as presentation:
                 presentation.save(pdf_path, slides.export.SaveFormat.PDF)
 
-            # Verification results
-            if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0:
-                print(
-                    f"✅ Conversion successful! PDFsize: {os.path.getsize(pdf_path)} byte"
-                )
+            # Verification results（once stat）
+            try:
+                pdf_size = os.path.getsize(pdf_path)
+            except OSError:
+                pdf_size = 0
+            if pdf_size > 0:
+                logger.debug(f"✅ Conversion successful! PDFsize: {pdf_size} byte")
                 return True
-            else:
-                print("❌ generatedPDFFile is empty")
-                # if attempt < max_retries - 1:
-                #    time.sleep(retry_delay)
-                #    continue
-                # return False
+            logger.debug("❌ generatedPDFFile is empty")
 
         except Exception as e:
-            print(f"❌ conversion attempt {attempt + 1} fail: {e}")
+            logger.debug(f"❌ conversion attempt {attempt + 1} fail: {e}")
 
-            if "being used by another process" in str(e):
-                print(
-                    f"💡 File is occupied，wait {retry_delay} Try again in seconds..."
-                )
-                """
-                time.sleep(retry_delay)
-                """
-            else:
+            if "being used by another process" not in str(e):
                 # Other errors are returned directly
                 return False
 
+            # File is occupied：exponential backoff and retry
+            if attempt < max_retries - 1:
+                wait = retry_delay * (2**attempt)
+                logger.debug(f"💡 File is occupied，wait {wait} Try again in seconds...")
+                time.sleep(wait)
+
     return False
 
 
+@functools.lru_cache(maxsize=64)
+def _template_hash_for(path, mtime_ns, size):
+    """Hash the given version of the template（mtime/size Only used as cache key）"""
+    with open(path, "rb") as f:
+        # Memory mapped hash：No need to copy the entire file to user mode buffer
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                file_hash = hashlib.sha256(mm).hexdigest()
+        else:
+            file_hash = hashlib.sha256(b"").hexdigest()
+    logger.debug(f"🔐 template hash: {file_hash[:16]}...")
+    return file_hash
+
+
 def calculate_template_hash(template_file):
-    """Calculate the hash value of the current template file"""
+    """Calculate the hash value of the current template file（Hits cache if unchanged）"""
     try:
-        if os.path.exists(template_file):
-            with open(template_file, "rb") as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-            print(f"🔐 template hash: {file_hash[:16]}...")
-            return file_hash
-        return ""
+        try:
+            st = os.stat(template_file)
+        except FileNotFoundError:
+            return ""
+        return _template_hash_for(
+            os.path.abspath(template_file), st.st_mtime_ns, st.st_size
+        )
     except Exception as e:
-        print(f"❌ Failed to calculate template hash: {e}")
+        logger.debug(f"❌ Failed to calculate template hash: {e}")
         return ""
 
 
+# Does the platform support deletion relative to directory fd（Unix；Windows Walk by path）
+_HAS_DIR_FD = (
+    os.open in os.supports_dir_fd
+    and os.unlink in os.supports_dir_fd
+    and os.rmdir in os.supports_dir_fd
+    and os.chmod in os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+_DIR_OPEN_FLAGS = (
+    os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+)
+
+
+def _rmtree_fd(dfd):
+    """Delete directory contents relative to an open directory fd（Failures ignored）"""
+    # List first and then delete，Avoid modifying the directory during iteration
+    with os.scandir(dfd) as it:
+        entries = list(it)
+
+    for entry in entries:
+        name = entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                sub = os.open(name, _DIR_OPEN_FLAGS, dir_fd=dfd)
+                try:
+                    _rmtree_fd(sub)
+                finally:
+                    os.close(sub)
+                os.rmdir(name, dir_fd=dfd)
+            else:
+                try:
+                    os.unlink(name, dir_fd=dfd)
+                except PermissionError:
+                    os.chmod(name, stat.S_IWRITE, dir_fd=dfd)
+                    os.unlink(name, dir_fd=dfd)
+        except OSError:
+            pass
+
+
 def force_delete_directory(directory: str, max_retries: int = 3, delay: float = 0.5):
     """
     Forcefully delete a directory，including beingGitlocked file
@@ -132,6 +228,9 @@ def force_delete_directory(directory: str, max_retries: int = 3, delay: float =
         delay: Retry interval（Second）
     """
 
+    # Undeletable path（Summarize the output once after each round）
+    failed = []
+
     def on_rm_error(func, path, exc_info):
         """Handle deletion errors"""
         # path does not exist，Return directly
@@ -143,8 +242,8 @@ def force_delete_directory(directory: str, max_retries: int = 3, delay: float =
             os.chmod(path, stat.S_IWRITE)
             func(path)
         except:
-            # if still fails，Log error but continue
-            print(f"⚠️ cannot be deleted {path}: {exc_info[1]}")
+            # if still fails，Record and continue
+            failed.append(path)
 
     for attempt in range(max_retries):
         try:
@@ -152,12 +251,17 @@ def force_delete_directory(directory: str, max_retries: int = 3, delay: float =
                 return
 
             # Try recursive deletion
+            failed.clear()
             shutil.rmtree(directory, onerror=on_rm_error)
-            print(f"✅ Delete successfully (try {attempt + 1})")
+            if failed:
+                logger.warning(
+                    f"⚠️ cannot be deleted {len(failed)} indivual path，For example: {failed[0]}"
+                )
+            logger.debug(f"✅ Delete successfully (try {attempt + 1})")
             return
 
         except Exception as e:
-            print(f"⚠️ Delete failed，Try again {attempt + 1}/{max_retries}: {e}")
+            logger.debug(f"⚠️ Delete failed，Try again {attempt + 1}/{max_retries}: {e}")
             if attempt < max_retries - 1:
                 time.sleep(delay)
             else:
@@ -166,22 +270,30 @@ def force_delete_directory(directory: str, max_retries: int = 3, delay: float =
                     # try to delete.gitDirectories are handled individually
                     git_dir = os.path.join(directory, ".git")
                     if os.path.exists(git_dir):
-                        print(f"🧹 Handle separately.gitTable of contents...")
-                        for root, dirs, files in os.walk(git_dir, topdown=False):
-                            for name in files:
-                                filepath = os.path.join(root, name)
-                                try:
-                                    os.chmod(filepath, stat.S_IWRITE)
-                                    os.unlink(filepath)
-                                except:
-                                    pass
-                            for name in dirs:
-                                dirpath = os.path.join(root, name)
-                                try:
-                                    os.chmod(dirpath, stat.S_IWRITE)
-                                    os.rmdir(dirpath)
-                                except:
-                                    pass
+                        logger.debug("🧹 Handle separately.gitTable of contents...")
+                        if _HAS_DIR_FD:
+                            # Relative directory fd delete，No full path resolution per file
+                            dfd = os.open(git_dir, _DIR_OPEN_FLAGS)
+                            try:
+                                _rmtree_fd(dfd)
+                            finally:
+                                os.close(dfd)
+                        else:
+                            for root, dirs, files in os.walk(git_dir, topdown=False):
+                                for name in files:
+                                    filepath = os.path.join(root, name)
+                                    try:
+                                        os.chmod(filepath, stat.S_IWRITE)
+                                        os.unlink(filepath)
+                                    except:
+                                        pass
+                                for name in dirs:
+                                    dirpath = os.path.join(root, name)
+                                    try:
+                                        os.chmod(dirpath, stat.S_IWRITE)
+                                        os.rmdir(dirpath)
+                                    except:
+                                        pass
                         try:
                             os.rmdir(git_dir)
                         except:
@@ -189,7 +301,7 @@ def force_delete_directory(directory: str, max_retries: int = 3, delay: float =
 
                     # Finally try deleting the entire directory
                     shutil.rmtree(directory, ignore_errors=True)
-                    print(f"✅ Forced deletion completed")
+                    logger.debug("✅ Forced deletion completed")
 
                 except Exception as final_error:
                     raise Exception(f"Even force deletion fails: {final_error}")